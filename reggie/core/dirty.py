@@ -2,7 +2,23 @@ from PyQt6 import QtCore
 
 from reggie.core import globals_
 
+# Counts level edits, so caches derived from the level can tell whether it
+# changed without re-reading every item. Bumped by SetDirty and by the undo
+# module (command bodies, bulk edit sessions, clearing the history)
+_editGeneration = 0
+
+def editGeneration():
+    """
+    Returns a counter that changes whenever the level may have been edited
+    """
+    return _editGeneration
+
+def bumpEditGeneration():
+    global _editGeneration
+    _editGeneration += 1
+
 def SetDirty(noautosave = False):
+    bumpEditGeneration()
     if globals_.DirtyOverride > 0: return
 
     if not noautosave: globals_.AutoSaveDirty = True
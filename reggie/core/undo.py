@@ -21,7 +21,7 @@ Design rules:
 from PyQt6 import QtCore, QtGui
 
 from reggie.core import globals_
-from reggie.core.dirty import SetDirty
+from reggie.core.dirty import SetDirty, bumpEditGeneration
 
 
 # Merge ids for QUndoCommand.id() (-1 = never merges)
@@ -46,6 +46,8 @@ class _ApplyGuard:
     def __exit__(self, exc_type, exc_value, traceback):
         global _apply_depth
         _apply_depth -= 1
+        # Push, undo, redo and remote operations all apply their edits here
+        bumpEditGeneration()
 
 
 def is_recording_blocked():
@@ -72,6 +74,7 @@ class UndoStack(QtGui.QUndoStack):
         """
         super().clear()
         self.setUndoLimit(getattr(globals_, 'UndoLimit', 500))
+        bumpEditGeneration()
 
     def undo(self):
         # Captured before the stack moves: afterwards `command(index())` is a
@@ -1250,6 +1253,7 @@ def notify_item_created(item):
     Reports a freshly created level item. Only recorded while a bulk edit
     session is open (normal interactive flows record via their own commands).
     """
+    bumpEditGeneration()
     if _bulk_session is not None and not is_recording_blocked() and item is not None:
         _bulk_session.created.append(item)
 
@@ -1294,6 +1298,7 @@ def bulk_remove_object(item):
     bulk code paths). Recorded if a bulk edit session is open.
     """
     ctx = _detach_item(item)
+    bumpEditGeneration()
 
     if _bulk_session is not None and not is_recording_blocked():
         _bulk_session.removed.append((item, ctx))
@@ -33,6 +33,18 @@ from .modes import SmartPaintMode, PaintingDirection
 from .logging import log_engine
 
 
+def pack_tile_key(x: int, y: int, layer: int) -> int:
+    """
+    Pack a tile position into a single int key for the empty slope region set.
+    
+    Coordinates are kept to 24 bits each, which covers any level position.
+    
+    Returns:
+        (layer << 48) | (y << 24) | x
+    """
+    return (layer << 48) | ((y & 0xFFFFFF) << 24) | (x & 0xFFFFFF)
+
+
 class PaintingMode(Enum):
     """Painting mode enumeration"""
     IMMEDIATE = "immediate"  # Paint immediately as mouse moves (holding paint key)
@@ -132,6 +144,8 @@ class PaintingSession:
         self.stroke_path = []
         self.pending_placements = []
         self.outline_positions = []
+        # Replaced rather than cleared: paint-end handlers keep a read-only
+        # view of the previous stroke's dict
         self.outline_tile_types = {}
         self.placed_tiles = set()
         self.initial_direction = None
@@ -192,7 +206,13 @@ class PaintingEngine:
         
         # Empty slope regions - positions within slope object bounds that are empty (-1)
         # These positions should NOT receive new tiles when painting through slopes
-        self._empty_slope_regions: Set[Tuple[int, int, int]] = set()
+        # Keys are packed with pack_tile_key
+        self._empty_slope_regions: Set[int] = set()
+        
+        # Bumped whenever the object database or the empty slope regions are
+        # replaced or edited, so callers can tell whether a database they
+        # handed over is still the current one
+        self._database_revision: int = 0
         
         # Path dampening settings
         # Higher values = more resistance to direction changes
@@ -669,43 +689,52 @@ class PaintingEngine:
                 return
     
     def update_object_database(self, database: Dict[Tuple[int, int, int], int], 
-                               empty_slope_regions: Set[Tuple[int, int, int]] = None):
+                               empty_slope_regions: Set[int] = None):
         """
         Update the object search database for fast tile lookups.
         
         Args:
             database: Dict mapping (x, y, layer) -> object_id
-            empty_slope_regions: Set of (x, y, layer) positions that are empty tiles
-                                 within slope object bounds (should not receive new tiles)
+            empty_slope_regions: Set of packed positions (see pack_tile_key) that are
+                                 empty tiles within slope object bounds (should not
+                                 receive new tiles)
         """
         self._object_database = database
         self.session.existing_tiles = database.copy()
         if empty_slope_regions is not None:
             self._empty_slope_regions = empty_slope_regions
+        self._database_revision += 1
+    
+    def get_database_revision(self) -> int:
+        """Get a counter that changes whenever the object database or empty slope regions change"""
+        return self._database_revision
     
-    def set_empty_slope_regions(self, regions: Set[Tuple[int, int, int]]):
+    def set_empty_slope_regions(self, regions: Set[int]):
         """
         Set the empty slope regions.
         
-        These are positions within slope object bounds that are empty (-1).
-        QPT should not place new tiles at these positions.
+        These are positions within slope object bounds that are empty (-1),
+        packed with pack_tile_key. QPT should not place new tiles at these positions.
         """
         self._empty_slope_regions = regions
+        self._database_revision += 1
     
     def is_in_empty_slope_region(self, x: int, y: int, layer: int) -> bool:
         """Check if a position is in an empty region of an existing slope object."""
-        return (x, y, layer) in self._empty_slope_regions
+        return pack_tile_key(x, y, layer) in self._empty_slope_regions
     
     def add_to_object_database(self, x: int, y: int, layer: int, object_id: int):
         """Add a single object to the database"""
         self._object_database[(x, y, layer)] = object_id
         self.session.existing_tiles[(x, y, layer)] = object_id
+        self._database_revision += 1
     
     def remove_from_object_database(self, x: int, y: int, layer: int):
         """Remove an object from the database"""
         key = (x, y, layer)
         self._object_database.pop(key, None)
         self.session.existing_tiles.pop(key, None)
+        self._database_revision += 1
     
     # =========================================================================
     # PAINTING OPERATIONS
@@ -1757,6 +1786,8 @@ class PaintingEngine:
         placements = []
         tiles_by_pos = {}
         skipped_empty_slope = 0
+        empty_slope_regions = self._empty_slope_regions
+        layer_key = self.layer << 48
         
         # First pass: handle slopes (they have fixed dimensions)
         for pos in self.session.outline_positions:
@@ -1768,7 +1799,7 @@ class PaintingEngine:
             
             # Skip if position is in an empty region of an existing slope object
             # This prevents ghost tiles when painting through large slope objects
-            if (x, y, self.layer) in self._empty_slope_regions:
+            if (layer_key | ((y & 0xFFFFFF) << 24) | (x & 0xFFFFFF)) in empty_slope_regions:
                 skipped_empty_slope += 1
                 continue
             
@@ -48,6 +48,15 @@ def log(message: str, prefix: str = "[QPT]"):
         except:
             pass
 
+def log_enabled() -> bool:
+    """
+    Check whether log() would write anywhere.
+    
+    Hot paths sample this once and skip building their messages entirely
+    when nothing would be written.
+    """
+    return _console_verbose or (_log_file is not None and _log_enabled)
+
 def log_engine(message: str):
     """Log a PaintingEngine message"""
     log(message, "[PaintingEngine]")
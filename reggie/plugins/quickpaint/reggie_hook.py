@@ -26,6 +26,7 @@ class ReggieQuickPaintHook:
         self.outline_items: List = []
         self.is_active = False
         self.hotkey_overlay = None
+        self._overlay_tool_keys: dict = {}  # ToolType -> hotkey overlay tool key
         self._main_window = None
     
     def initialize(self, main_window):
@@ -63,7 +64,15 @@ class ReggieQuickPaintHook:
         QtCore.QTimer.singleShot(500, self._create_hotkey_overlay)
         
         # Connect tool changes to update overlay
-        from reggie.plugins.quickpaint.core.tool_manager import get_tool_manager
+        from reggie.plugins.quickpaint.core.tool_manager import get_tool_manager, ToolType
+        self._overlay_tool_keys = {
+            ToolType.QPT_SMART_PAINT: "qpt",
+            ToolType.QPT_SINGLE_TILE: "single_tile",
+            ToolType.QPT_ERASER: "eraser",
+            ToolType.QPT_SHAPE_CREATOR: "shape_creator",
+            ToolType.FILL_PAINT: "fill",
+            ToolType.DECO_FILL: "deco",
+        }
         tool_manager = get_tool_manager()
         tool_manager.tool_changed.connect(self._on_tool_changed_for_overlay)
         
@@ -109,22 +118,7 @@ class ReggieQuickPaintHook:
         if not self.hotkey_overlay:
             return
         
-        from reggie.plugins.quickpaint.core.tool_manager import ToolType
-        
-        if new_tool == ToolType.QPT_SMART_PAINT:
-            self.hotkey_overlay.set_active_tool("qpt")
-        elif new_tool == ToolType.QPT_SINGLE_TILE:
-            self.hotkey_overlay.set_active_tool("single_tile")
-        elif new_tool == ToolType.QPT_ERASER:
-            self.hotkey_overlay.set_active_tool("eraser")
-        elif new_tool == ToolType.QPT_SHAPE_CREATOR:
-            self.hotkey_overlay.set_active_tool("shape_creator")
-        elif new_tool == ToolType.FILL_PAINT:
-            self.hotkey_overlay.set_active_tool("fill")
-        elif new_tool == ToolType.DECO_FILL:
-            self.hotkey_overlay.set_active_tool("deco")
-        else:
-            self.hotkey_overlay.set_active_tool(None)
+        self.hotkey_overlay.set_active_tool(self._overlay_tool_keys.get(new_tool))
     
     def show_hotkey_overlay(self):
         """Show the hotkey overlay"""
@@ -7,11 +7,15 @@ Supports both immediate and deferred painting modes.
 from typing import Optional, Tuple, List
 from enum import Enum
 from PyQt6 import QtCore, QtGui
+from PyQt6.QtCore import Qt
 
 from reggie.plugins.quickpaint.core.painter import PaintOperation
 from reggie.plugins.quickpaint.core.engine import PaintingEngine, ObjectPlacement, PaintingMode, PaintingState as EngineState
 from reggie.plugins.quickpaint.core.brush import SmartBrush
 
+_KEY_ESCAPE = Qt.Key.Key_Escape
+_KEY_F1 = Qt.Key.Key_F1
+
 
 class PaintingState(Enum):
     """Painting state enumeration (legacy compatibility)"""
@@ -34,6 +38,14 @@ class MouseEventHandler(QtCore.QObject):
     - Start object selection for deferred mode
     """
     
+    # Fixed attribute layout for the per-event hot paths. sip wrappers already
+    # carry their own __dict__, so it must not be listed here.
+    __slots__ = (
+        'engine', 'state', 'brush', 'mode',
+        'start_pos', 'current_pos', 'stroke_path', 'operations', 'outline',
+        'start_object', 'is_immediate_mode', '_key_handlers',
+    )
+    
     # Signals
     painting_started = QtCore.pyqtSignal()
     painting_ended = QtCore.pyqtSignal(list)  # List of ObjectPlacement
@@ -72,6 +84,12 @@ class MouseEventHandler(QtCore.QObject):
         # Deferred mode state
         self.start_object: Optional[Tuple[int, int]] = None  # Position of start object
         self.is_immediate_mode: bool = False  # True when paint key is held
+        
+        # Key dispatch table for on_key_press
+        self._key_handlers = {
+            _KEY_ESCAPE: self._handle_escape,
+            _KEY_F1: self._handle_f1,
+        }
     
     def set_brush(self, brush: SmartBrush):
         """
@@ -121,11 +139,24 @@ class MouseEventHandler(QtCore.QObject):
         
         Args:
             database: Dict mapping (x, y, layer) -> object_id
-            empty_slope_regions: Set of (x, y, layer) positions that are empty tiles
+            empty_slope_regions: Set of packed positions (see engine.pack_tile_key) that are empty tiles
                                  within slope object bounds
         """
         self.engine.update_object_database(database, empty_slope_regions)
     
+    def needs_terrain_db(self) -> bool:
+        """
+        Check whether the next press needs a fresh object database.
+        
+        The database only feeds the engine's terrain-aware painting: a press
+        without a brush is ignored, and in slope mode presses do not paint
+        (the slope is committed on release).
+        
+        Returns:
+            True if the caller should refresh the object database first
+        """
+        return self.brush is not None and not self.engine.session.slope_mode
+    
     # =========================================================================
     # ENGINE CALLBACKS
     # =========================================================================
@@ -220,7 +251,7 @@ class MouseEventHandler(QtCore.QObject):
         Handle key press event.
         
         ESC key cancels the current deferred painting path.
-        Shift key toggles slope mode.
+        F1 key toggles slope mode.
         
         Args:
             key: Qt key code
@@ -228,22 +259,24 @@ class MouseEventHandler(QtCore.QObject):
         Returns:
             True if event was handled, False otherwise
         """
-        from PyQt6.QtCore import Qt
-        
-        if key == Qt.Key.Key_Escape:
-            if self.state == PaintingState.DEFERRED or self.start_object is not None:
-                print("[MouseEventHandler] ESC pressed, cancelling deferred path")
-                self.cancel_painting()
-                return True
-        
-        if key == Qt.Key.Key_F1:
-            if self.state == PaintingState.DEFERRED:
-                # Toggle slope mode
-                in_slope_mode = self.engine.toggle_slope_mode()
-                print(f"[MouseEventHandler] F1 pressed, slope_mode={in_slope_mode}")
-                self.outline_updated.emit()
-                return True
-        
+        handler = self._key_handlers.get(key)
+        return handler() if handler else False
+    
+    def _handle_escape(self) -> bool:
+        """ESC cancels the current deferred painting path"""
+        if self.state == PaintingState.DEFERRED or self.start_object is not None:
+            print("[MouseEventHandler] ESC pressed, cancelling deferred path")
+            self.cancel_painting()
+            return True
+        return False
+    
+    def _handle_f1(self) -> bool:
+        """F1 toggles slope mode while a deferred path is active"""
+        if self.state == PaintingState.DEFERRED:
+            in_slope_mode = self.engine.toggle_slope_mode()
+            print(f"[MouseEventHandler] F1 pressed, slope_mode={in_slope_mode}")
+            self.outline_updated.emit()
+            return True
         return False
     
     def on_mouse_move(self, pos: Tuple[int, int]) -> bool:
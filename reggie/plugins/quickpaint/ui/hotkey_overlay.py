@@ -5,10 +5,141 @@ Shows two containers:
 - Container 1 (left): Main tab hotkeys (P, Q, F, D)
 - Container 2 (right): Active tool hotkeys
 """
+from functools import lru_cache
 from typing import Optional
 from PyQt6 import QtWidgets, QtCore, QtGui
 
 
+# Main container rows, as (key, description) pairs
+_MAIN_HOTKEYS = (
+    ("P", "Quick Paint Tab"),
+    ("Q", "Smart Paint"),
+    ("S", "Single Tile"),
+    ("C", "Shape Creator"),
+    ("E", "Eraser"),
+    ("F", "Fill Tool"),
+    ("D", "Deco Fill"),
+)
+
+# Tool type -> (container title, hotkey rows)
+_TOOL_HOTKEYS = {
+    "qpt": ("Smart Paint", (
+        ("Q", "Start/Stop"),
+        ("RClick", "Draw stroke"),
+        ("RClick", "Confirm"),
+        ("F1", "Slope Mode"),
+        ("ESC", "Cancel"),
+        ("", ""),
+        ("", ""),
+    )),
+    "fill": ("Fill Tool", (
+        ("RClick", "Create area"),
+        ("RClick", "Confirm fill"),
+        ("Shift", "Outside zones"),
+        ("F2", "Clear area"),
+        ("ESC", "Cancel"),
+        ("", ""),
+        ("", ""),
+    )),
+    "deco": ("Deco Fill", (
+        ("RClick", "Create area"),
+        ("RClick", "Confirm fill"),
+        ("Shift", "Outside zones"),
+        ("F2", "Clear area"),
+        ("ESC", "Cancel"),
+        ("", ""),
+        ("", ""),
+    )),
+    "single_tile": ("Single Tile", (
+        ("RClick", "Paint tile"),
+        ("Drag", "Paint stroke"),
+        ("", ""),
+        ("", ""),
+        ("", ""),
+        ("", ""),
+        ("", ""),
+    )),
+    "eraser": ("Eraser", (
+        ("RClick", "Erase tile"),
+        ("Drag", "Erase stroke"),
+        ("", ""),
+        ("", ""),
+        ("", ""),
+        ("", ""),
+        ("", ""),
+    )),
+    "shape_creator": ("Shape Creator", (
+        ("", "Coming Soon"),
+        ("", ""),
+        ("", ""),
+        ("", ""),
+        ("", ""),
+        ("", ""),
+        ("", ""),
+    )),
+}
+_NO_TOOL_HOTKEYS = ("No Tool", ())
+
+
+@lru_cache(maxsize=None)
+def _hotkey_font(bold: bool = False) -> QtGui.QFont:
+    """Shared 9pt overlay font, created on first use once Qt is running"""
+    font = QtGui.QFont()
+    font.setPointSize(9)
+    font.setBold(bold)
+    return font
+
+
+@lru_cache(maxsize=128)
+def _format_description(desc: str) -> str:
+    """Format a hotkey description, reusing the same str for repeated rows"""
+    return f": {desc}"
+
+
+class HotkeyRow(QtWidgets.QWidget):
+    """
+    Single hotkey row: a bold key label followed by a plain description.
+    
+    Both labels use plain text so Qt never runs its rich text detection or
+    HTML parser when the row is updated.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        layout = QtWidgets.QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        
+        self.key_label = QtWidgets.QLabel(self)
+        self.desc_label = QtWidgets.QLabel(self)
+        for label in (self.key_label, self.desc_label):
+            label.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+            # Set before addWidget so the initial polish picks up the rule
+            label.setProperty("role", "hotkey")
+            layout.addWidget(label)
+        layout.addStretch()
+        
+        self.key_label.setFont(_hotkey_font(bold=True))
+        
+        # Strings last passed to setText. Rows come from the module-level
+        # tables and descriptions from _format_description, so unchanged
+        # text is usually the very same str object and skips the QString
+        # round trip of QLabel.text().
+        self._key = ""
+        self._desc = ""
+    
+    def set_hotkey(self, key: str, desc: str):
+        """Set the key and description shown by this row"""
+        if key is not self._key and key != self._key:
+            self._key = key
+            self.key_label.setText(key)
+        desc = _format_description(desc)
+        if desc is not self._desc and desc != self._desc:
+            self._desc = desc
+            self.desc_label.setText(desc)
+
+
 class HotkeyContainer(QtWidgets.QFrame):
     """
     Container for hotkey display.
@@ -16,19 +147,32 @@ class HotkeyContainer(QtWidgets.QFrame):
     Shows a title and list of hotkeys. Extendable for future additions.
     """
     
+    # Single stylesheet for all child labels, parsed once per container
+    # instead of once per label. The frame itself is drawn in paintEvent.
+    _STYLESHEET = """
+        HotkeyContainer > QLabel#title {
+            color: rgba(230, 230, 230, 240);
+        }
+        HotkeyContainer QLabel[role="hotkey"] {
+            color: rgba(220, 220, 220, 230);
+            padding: 1px 0px;
+        }
+    """
+    
+    # Frame colors (more transparent background)
+    _BACKGROUND_COLOR = QtGui.QColor(20, 20, 20, 120)
+    _BORDER_COLOR = QtGui.QColor(80, 80, 80, 150)
+    _BORDER_RADIUS = 4
+    
+    # Number of hotkey rows pre-allocated per container
+    _POOL_SIZE = 7
+    
     def __init__(self, title: str, parent=None):
         super().__init__(parent)
         self.title = title
-        self._hotkeys = []
+        self._hotkeys = ()
         
-        # More transparent background
-        self.setStyleSheet("""
-            HotkeyContainer {
-                background-color: rgba(20, 20, 20, 120);
-                border: 1px solid rgba(80, 80, 80, 150);
-                border-radius: 4px;
-            }
-        """)
+        self.setStyleSheet(self._STYLESHEET)
         
         self.init_ui()
     
@@ -40,48 +184,76 @@ class HotkeyContainer(QtWidgets.QFrame):
         
         # Title label (no toggle button)
         self.title_label = QtWidgets.QLabel(self.title)
-        self.title_label.setStyleSheet("""
-            color: rgba(230, 230, 230, 240);
-            font-weight: bold;
-            font-size: 9pt;
-        """)
+        self.title_label.setObjectName("title")
+        self.title_label.setFont(_hotkey_font(bold=True))
         layout.addWidget(self.title_label)
         
         # Content area for hotkeys
         self.content_widget = QtWidgets.QWidget()
+        self.content_widget.setFont(_hotkey_font())
         self.content_layout = QtWidgets.QVBoxLayout(self.content_widget)
         self.content_layout.setContentsMargins(0, 2, 0, 0)
         self.content_layout.setSpacing(2)
         
+        # Pool of reusable hotkey rows; rows are hidden rather than deleted
+        self._row_pool = []
+        for _ in range(self._POOL_SIZE):
+            self._add_pool_row()
+        
         layout.addWidget(self.content_widget)
     
-    def set_hotkeys(self, hotkeys: list):
+    def _add_pool_row(self) -> HotkeyRow:
+        """Create a hidden hotkey row and append it to the pool"""
+        row = HotkeyRow(self.content_widget)
+        row.hide()
+        self.content_layout.addWidget(row)
+        self._row_pool.append(row)
+        return row
+    
+    def set_hotkeys(self, hotkeys: tuple):
         """
         Set the hotkeys to display.
         
         Args:
-            hotkeys: List of (key, description) tuples
+            hotkeys: Tuple of (key, description) tuples
         """
-        self._hotkeys = hotkeys
-        
-        # Clear existing
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Rows from the module-level tables are matched by identity
+        if hotkeys is self._hotkeys or hotkeys == self._hotkeys:
+            return
+        self._hotkeys = hotkeys = tuple(hotkeys)
         
-        # Add new hotkey labels
-        for key, desc in hotkeys:
-            label = QtWidgets.QLabel(f"<b>{key}</b>: {desc}")
-            label.setStyleSheet("""
-                color: rgba(220, 220, 220, 230);
-                font-size: 9pt;
-                padding: 1px 0px;
-            """)
-            self.content_layout.addWidget(label)
+        # Batch all row changes into a single repaint and relayout
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            while len(self._row_pool) < len(hotkeys):
+                self._add_pool_row()
+            
+            # Reuse pooled rows, hiding the ones not needed for this tool
+            for row, (key, desc) in zip(self._row_pool, hotkeys):
+                row.set_hotkey(key, desc)
+                row.show()
+            
+            for row in self._row_pool[len(hotkeys):]:
+                row.hide()
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
+    
+    def paintEvent(self, event):
+        """Draw the rounded, semi-transparent frame"""
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, False)
+        painter.setBrush(self._BACKGROUND_COLOR)
+        painter.setPen(self._BORDER_COLOR)
+        painter.drawRoundedRect(
+            QtCore.QRectF(self.rect().adjusted(0, 0, -1, -1)),
+            self._BORDER_RADIUS, self._BORDER_RADIUS,
+        )
+        painter.end()
     
     def set_title(self, title: str):
         """Set the container title"""
+        if title == self.title:
+            return
         self.title = title
         self.title_label.setText(title)
 
@@ -93,125 +265,114 @@ class HotkeyOverlay(QtWidgets.QWidget):
     Positioned 1 tile (24px) from top and left edges.
     Contains two containers for hotkey display.
     Only visible when Quick Paint tab is active.
+    
+    The containers live in an offscreen host widget. Their content is static
+    per tool, so each tool is rasterized into a QPixmap once and the overlay
+    simply blits the cached pixmap when painting.
     """
     
+    # Horizontal gap between the two containers
+    _CONTAINER_SPACING = 8
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
         self._current_tool = None
+        self._pixmap: Optional[QtGui.QPixmap] = None
+        self._pixmap_cache: dict = {}
+        
+        # Coalesce bursts of position updates into one move per event loop pass
+        self._pending_geo: Optional[QtCore.QRect] = None
+        self._pending_tool: Optional[str] = None
+        self._move_timer = QtCore.QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(0)
+        self._move_timer.timeout.connect(self._apply_move)
         
         # Make widget transparent to mouse events except for the containers
         self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
-        self.setStyleSheet("background: transparent;")
+        
+        # The cached pixmap carries its own alpha, so skip the background fill
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground, True)
         
         self.init_ui()
         self.hide()  # Hidden by default
     
     def init_ui(self):
         """Initialize the UI"""
-        layout = QtWidgets.QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(8)
-        layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop)
+        # Offscreen host for the containers; never shown, only rendered.
+        # The two containers are placed explicitly rather than through a
+        # layout, since their arrangement never changes.
+        self._render_host = QtWidgets.QWidget()
         
         # Container 1: Main hotkeys (left)
-        self.main_container = HotkeyContainer("Tools (F3)")
-        self.main_container.set_hotkeys([
-            ("P", "Quick Paint Tab"),
-            ("Q", "Smart Paint"),
-            ("S", "Single Tile"),
-            ("C", "Shape Creator"),
-            ("E", "Eraser"),
-            ("F", "Fill Tool"),
-            ("D", "Deco Fill"),
-        ])
-        layout.addWidget(self.main_container)
+        self.main_container = HotkeyContainer("Tools (F3)", self._render_host)
+        self.main_container.set_hotkeys(_MAIN_HOTKEYS)
+        # Content never changes, so pin the size and skip future size hints
+        self.main_container.setFixedSize(self.main_container.sizeHint())
+        self.main_container.move(0, 0)
         
         # Container 2: Tool-specific hotkeys (right)
-        self.tool_container = HotkeyContainer("Smart Paint")
-        self._update_tool_hotkeys("qpt")
-        layout.addWidget(self.tool_container)
-        
-        layout.addStretch()
+        self.tool_container = HotkeyContainer("Smart Paint", self._render_host)
         
-        # Set fixed size based on content
-        self.adjustSize()
+        self._update_tool_hotkeys("qpt")
     
     def _update_tool_hotkeys(self, tool_type: str):
         """Update tool-specific hotkeys based on active tool"""
         self._current_tool = tool_type
         
-        if tool_type == "qpt":
-            self.tool_container.set_title("Smart Paint")
-            self.tool_container.set_hotkeys([
-                ("Q", "Start/Stop"),
-                ("RClick", "Draw stroke"),
-                ("RClick", "Confirm"),
-                ("F1", "Slope Mode"),
-                ("ESC", "Cancel"),
-                ("", ""),
-                ("", ""),
-            ])
-        elif tool_type == "fill":
-            self.tool_container.set_title("Fill Tool")
-            self.tool_container.set_hotkeys([
-                ("RClick", "Create area"),
-                ("RClick", "Confirm fill"),
-                ("Shift", "Outside zones"),
-                ("F2", "Clear area"),
-                ("ESC", "Cancel"),
-                ("", ""),
-                ("", ""),
-            ])
-        elif tool_type == "deco":
-            self.tool_container.set_title("Deco Fill")
-            self.tool_container.set_hotkeys([
-                ("RClick", "Create area"),
-                ("RClick", "Confirm fill"),
-                ("Shift", "Outside zones"),
-                ("F2", "Clear area"),
-                ("ESC", "Cancel"),
-                ("", ""),
-                ("", ""),
-            ])
-        elif tool_type == "single_tile":
-            self.tool_container.set_title("Single Tile")
-            self.tool_container.set_hotkeys([
-                ("RClick", "Paint tile"),
-                ("Drag", "Paint stroke"),
-                ("", ""),
-                ("", ""),
-                ("", ""),
-                ("", ""),
-                ("", ""),
-            ])
-        elif tool_type == "eraser":
-            self.tool_container.set_title("Eraser")
-            self.tool_container.set_hotkeys([
-                ("RClick", "Erase tile"),
-                ("Drag", "Erase stroke"),
-                ("", ""),
-                ("", ""),
-                ("", ""),
-                ("", ""),
-                ("", ""),
-            ])
-        elif tool_type == "shape_creator":
-            self.tool_container.set_title("Shape Creator")
-            self.tool_container.set_hotkeys([
-                ("", "Coming Soon"),
-                ("", ""),
-                ("", ""),
-                ("", ""),
-                ("", ""),
-                ("", ""),
-                ("", ""),
-            ])
-        else:
-            self.tool_container.set_title("No Tool")
-            self.tool_container.set_hotkeys([])
+        pixmap = self._pixmap_cache.get(tool_type)
+        if pixmap is None:
+            title, rows = _TOOL_HOTKEYS.get(tool_type, _NO_TOOL_HOTKEYS)
+            self.tool_container.set_title(title)
+            self.tool_container.set_hotkeys(rows)
+            
+            self._place_containers()
+            pixmap = self._render_pixmap()
+            self._pixmap_cache[tool_type] = pixmap
         
-        self.adjustSize()
+        self._pixmap = pixmap
+        self.resize(pixmap.deviceIndependentSize().toSize())
+        self.update()
+    
+    def _place_containers(self):
+        """Position the containers side by side and size the host to fit"""
+        main = self.main_container
+        tool = self.tool_container
+        
+        # Most tools share the same row count, so only resize when the
+        # content actually needs a different size. The size is pinned so
+        # layout passes between content changes skip size hint computation.
+        tool_size = tool.sizeHint()
+        if tool_size != tool.size():
+            tool.setFixedSize(tool_size)
+        
+        main_w = main.width()
+        tool.move(main_w + self._CONTAINER_SPACING, 0)
+        self._render_host.resize(
+            main_w + self._CONTAINER_SPACING + tool_size.width(),
+            max(main.height(), tool_size.height()),
+        )
+    
+    def _render_pixmap(self) -> QtGui.QPixmap:
+        """Rasterize the offscreen containers into a transparent pixmap"""
+        host = self._render_host
+        ratio = self.devicePixelRatioF()
+        pixmap = QtGui.QPixmap(host.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+        # Skip the window background so the pixmap keeps its alpha channel
+        host.render(pixmap, QtCore.QPoint(), QtGui.QRegion(),
+                    QtWidgets.QWidget.RenderFlag.DrawChildren)
+        return pixmap
+    
+    def paintEvent(self, event):
+        """Blit the cached hotkey pixmap"""
+        if self._pixmap is not None:
+            painter = QtGui.QPainter(self)
+            painter.drawPixmap(0, 0, self._pixmap)
+            painter.end()
     
     def set_active_tool(self, tool_type: str):
         """
@@ -220,8 +381,15 @@ class HotkeyOverlay(QtWidgets.QWidget):
         Args:
             tool_type: One of "qpt", "fill", "deco", or None
         """
+        tool_type = tool_type or "qpt"
+        
+        # While hidden, only remember the tool; show_overlay applies it
+        if not self.isVisible():
+            self._pending_tool = tool_type
+            return
+        
         if tool_type != self._current_tool:
-            self._update_tool_hotkeys(tool_type or "qpt")
+            self._update_tool_hotkeys(tool_type)
     
     def position_overlay(self, view_geometry: QtCore.QRect):
         """
@@ -230,6 +398,19 @@ class HotkeyOverlay(QtWidgets.QWidget):
         Args:
             view_geometry: The geometry of the graphics view in parent coordinates
         """
+        self._pending_geo = QtCore.QRect(view_geometry)
+        
+        # While hidden, only remember the geometry; show_overlay applies it
+        if self.isVisible() and not self._move_timer.isActive():
+            self._move_timer.start()
+    
+    def _apply_move(self):
+        """Move the overlay to the most recently requested view geometry"""
+        view_geometry = self._pending_geo
+        if view_geometry is None:
+            return
+        self._pending_geo = None
+        
         # Position exactly 1 tile (24px) from top and left of the view
         x = view_geometry.x() + 24
         y = view_geometry.y()  # No extra offset - view.y() already accounts for toolbar
@@ -237,6 +418,14 @@ class HotkeyOverlay(QtWidgets.QWidget):
     
     def show_overlay(self):
         """Show the overlay"""
+        # Apply updates received while hidden (or still queued) before showing,
+        # so the overlay never appears stale or misplaced
+        if self._pending_tool is not None:
+            if self._pending_tool != self._current_tool:
+                self._update_tool_hotkeys(self._pending_tool)
+            self._pending_tool = None
+        self._move_timer.stop()
+        self._apply_move()
         self.show()
         self.raise_()  # Ensure it's on top
     
@@ -245,26 +434,93 @@ class HotkeyOverlay(QtWidgets.QWidget):
         self.hide()
 
 
-def create_hotkey_overlay(main_window) -> Optional[HotkeyOverlay]:
+class LazyHotkeyOverlay:
+    """
+    Stand-in for HotkeyOverlay that builds the real widget on first show.
+    
+    The overlay is hidden by default, so its widgets, stylesheets and layout
+    are only created once the user actually displays it. Tool and position
+    updates received before that are remembered and applied on creation.
+    """
+    
+    def __init__(self, main_window):
+        self._main_window = main_window
+        self._overlay: Optional[HotkeyOverlay] = None
+        self._pending_tool: Optional[str] = None
+        self._pending_geo: Optional[QtCore.QRect] = None
+    
+    def _get_overlay(self) -> Optional[HotkeyOverlay]:
+        """Create the real overlay if needed and return it"""
+        if self._overlay is None:
+            try:
+                # Create overlay as child of central widget to overlay the view
+                self._overlay = HotkeyOverlay(self._main_window.centralWidget())
+            except Exception as e:
+                print(f"[QPT] Error creating hotkey overlay: {e}")
+                return None
+            
+            if self._pending_tool is not None:
+                self._overlay.set_active_tool(self._pending_tool)
+            if self._pending_geo is not None:
+                self._overlay.position_overlay(self._pending_geo)
+            self._pending_tool = self._pending_geo = None
+        return self._overlay
+    
+    def set_active_tool(self, tool_type: str):
+        """Set the active tool, deferring it until the overlay exists"""
+        if self._overlay is None:
+            self._pending_tool = tool_type or "qpt"
+        else:
+            self._overlay.set_active_tool(tool_type)
+    
+    def position_overlay(self, view_geometry: QtCore.QRect):
+        """Position the overlay, deferring it until the overlay exists"""
+        if self._overlay is None:
+            self._pending_geo = QtCore.QRect(view_geometry)
+        else:
+            self._overlay.position_overlay(view_geometry)
+    
+    def show_overlay(self):
+        """Show the overlay, creating it on first use"""
+        overlay = self._get_overlay()
+        if overlay:
+            overlay.show_overlay()
+    
+    def hide_overlay(self):
+        """Hide the overlay if it has been created"""
+        if self._overlay is not None:
+            self._overlay.hide_overlay()
+    
+    def isVisible(self) -> bool:
+        """Whether the overlay is currently shown"""
+        return self._overlay is not None and self._overlay.isVisible()
+
+
+def create_hotkey_overlay(main_window) -> Optional[LazyHotkeyOverlay]:
     """
     Create and attach the hotkey overlay to the main window.
     
+    The widget itself is built lazily on the first show_overlay() call.
+    
     Args:
         main_window: Reggie's main window
         
     Returns:
-        HotkeyOverlay widget or None if creation failed
+        LazyHotkeyOverlay proxy or None if creation failed
     """
-    try:
-        # Create overlay as child of central widget to overlay the view
-        overlay = HotkeyOverlay(main_window.centralWidget())
-        
-        # Position it (will be updated when view geometry changes)
-        if hasattr(main_window, 'view') and main_window.view:
-            view_geo = main_window.view.geometry()
-            overlay.position_overlay(view_geo)
-        
-        return overlay
-    except Exception as e:
-        print(f"[QPT] Error creating hotkey overlay: {e}")
+    if not hasattr(main_window, 'centralWidget'):
+        print("[QPT] Error creating hotkey overlay: main window has no central widget")
         return None
+    
+    overlay = LazyHotkeyOverlay(main_window)
+    
+    # Position it (will be updated when view geometry changes)
+    view = getattr(main_window, 'view', None)
+    if view:
+        try:
+            overlay.position_overlay(view.geometry())
+        except RuntimeError:
+            # View not ready yet (underlying C++ object missing)
+            pass
+    
+    return overlay
@@ -1,9 +1,20 @@
 """
 Reggie Integration - Integrates QPT into Reggie's UI and event system
 """
+import functools
+import itertools
+import operator
+import random
+import types
+from array import array
+from collections import defaultdict, deque
 from typing import Optional, Dict, List
 from PyQt6 import QtWidgets, QtCore, QtGui
 
+from reggie.plugins.quickpaint.core.engine import pack_tile_key
+from reggie.plugins.quickpaint.core.logging import log, log_enabled
+from reggie.plugins.quickpaint.core.tool_manager import ToolType
+
 # Defer imports to avoid QWidget creation before QApplication is ready
 # from reggie.plugins.quickpaint.ui.widget import QuickPaintWidget
 # from reggie.plugins.quickpaint.ui.tileset_selector import TilesetSelector
@@ -11,6 +22,585 @@ from PyQt6 import QtWidgets, QtCore, QtGui
 # from reggie.plugins.quickpaint.core.presets import PresetManager
 
 
+# Bucket size (in tiles, as a shift) of the per-stroke spatial index used by
+# _delete_tile_at and of the fill-area grid used by _clear_fill_area
+_SPATIAL_BUCKET_SHIFT = 4
+
+# Direction (dx, dy) from an outline tile type towards the inside of the
+# shape it bounds; used to seed auto-fill candidates
+_INSIDE_OFFSETS = {
+    'top': (0, 1),       # Inside is below
+    'bottom': (0, -1),   # Inside is above
+    'left': (1, 0),      # Inside is to the right
+    'right': (-1, 0),    # Inside is to the left
+    'top_left': (1, 1),
+    'top_right': (-1, 1),
+    'bottom_left': (1, -1),
+    'bottom_right': (-1, -1),
+    'inner_top_left': (-1, -1),
+    'inner_top_right': (1, -1),
+    'inner_bottom_left': (-1, 1),
+    'inner_bottom_right': (1, 1),
+}
+
+# Fields of a level object that determine its tiles in the object database
+_OBJECT_SIGNATURE = operator.attrgetter('tileset', 'type', 'objx', 'objy', 'width', 'height')
+
+# QPT modes that paint directly, without Start Painting
+_SIMPLE_BRUSH_MODES = frozenset(("Single Tile", "Eraser"))
+
+# Key codes the palette forwards to the main window as QPT hotkeys
+_QPT_HOTKEYS = frozenset(key.value for key in (
+    QtCore.Qt.Key.Key_Q,
+    QtCore.Qt.Key.Key_S,
+    QtCore.Qt.Key.Key_C,
+    QtCore.Qt.Key.Key_E,
+    QtCore.Qt.Key.Key_F,
+    QtCore.Qt.Key.Key_D,
+    QtCore.Qt.Key.Key_Escape,
+    QtCore.Qt.Key.Key_F1,
+))
+
+# Quick Paint modes among the tools (the Fill/Deco radio buttons are cleared
+# while one of them is active)
+_QPT_TOOLS = frozenset((
+    ToolType.QPT_SMART_PAINT,
+    ToolType.QPT_SINGLE_TILE,
+    ToolType.QPT_ERASER,
+    ToolType.QPT_SHAPE_CREATOR,
+))
+
+# Background color of the palette's active tool label per tool; any other
+# tool shows "No Tool" in _NO_TOOL_COLOR
+_TOOL_LABEL_COLORS = {
+    ToolType.QPT_SMART_PAINT: "#2d5a2d",
+    ToolType.QPT_SINGLE_TILE: "#2d5a2d",
+    ToolType.QPT_ERASER: "#2d5a2d",
+    ToolType.QPT_SHAPE_CREATOR: "#2d5a2d",
+    ToolType.FILL_PAINT: "#3d6a9f",
+    ToolType.DECO_FILL: "#5a3d7a",
+    ToolType.TILESET_OVERLAY: "#7a5a3d",
+}
+_NO_TOOL_COLOR = "#555555"
+
+# Active tool label stylesheet per background color, formatted once
+_TOOL_LABEL_STYLESHEETS = {
+    color: (f"background-color: {color}; color: white; padding: 2px 6px; "
+            "font-weight: bold; font-size: 9pt;")
+    for color in {*_TOOL_LABEL_COLORS.values(), _NO_TOOL_COLOR}
+}
+
+# Reggie core modules used by the painting hot paths. They cannot be imported
+# at module load (import order with the main window), so they are imported
+# once on first use and cached here instead of re-importing on every stroke.
+_lazy: Optional[types.SimpleNamespace] = None
+
+
+def _imports() -> types.SimpleNamespace:
+    """Import the deferred Reggie modules once and return them"""
+    global _lazy
+    if _lazy is None:
+        from reggie.core import globals_
+        from reggie.core import undo as undo_module
+        from reggie.core.dirty import SetDirty, editGeneration
+        from reggie.core.levelitems import ObjectItem
+        from reggie.core.tiles import RenderObject
+        from reggie.plugins.quickpaint.reggie_hook import apply_terrain_aware_deletes
+        
+        _lazy = types.SimpleNamespace(
+            globals_=globals_,
+            undo_module=undo_module,
+            SetDirty=SetDirty,
+            editGeneration=editGeneration,
+            ObjectItem=ObjectItem,
+            RenderObject=RenderObject,
+            apply_terrain_aware_deletes=apply_terrain_aware_deletes,
+        )
+    return _lazy
+
+
+# QPT widget classes, imported on first use for the same reason as above and
+# shared by every tab instance (palettes can be closed and reopened)
+_widget_classes: Optional[types.SimpleNamespace] = None
+
+
+def _widgets() -> types.SimpleNamespace:
+    """Import the QPT widget classes once and return them"""
+    global _widget_classes
+    if _widget_classes is None:
+        print("[QPT] Importing QPT widget classes...")
+        from reggie.plugins.quickpaint.core.presets import PresetManager
+        from reggie.plugins.quickpaint.ui.events import MouseEventHandler
+        from reggie.plugins.quickpaint.ui.tileset_selector import TilesetSelector
+        from reggie.plugins.quickpaint.ui.widget import QuickPaintWidget
+        print("[QPT] OK: QPT widget classes imported")
+        
+        _widget_classes = types.SimpleNamespace(
+            PresetManager=PresetManager,
+            MouseEventHandler=MouseEventHandler,
+            TilesetSelector=TilesetSelector,
+            QuickPaintWidget=QuickPaintWidget,
+        )
+    return _widget_classes
+
+
+# Object definitions the RenderObject cache was built from (one entry per tileset)
+_render_cache_defs: Optional[list] = None
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_tile_runs(tileset: int, obj_type: int, width: int, height: int) -> tuple:
+    """
+    Memoized RenderObject, reduced to the runs of filled tiles in each row.
+    
+    Levels reuse a handful of object kinds, so most lookups are cache hits.
+    Call _validate_render_cache() before a pass to drop stale entries.
+    
+    Returns:
+        One tuple per object row of (start_dx, length) runs of tiles that are
+        not -1 (empty slope tiles are left out)
+    """
+    tile_array = _imports().RenderObject(tileset, obj_type, width, height)
+    rows = []
+    for dy in range(height):
+        row = tile_array[dy] if dy < len(tile_array) else ()
+        runs = []
+        run_start = None
+        for dx in range(width):
+            filled = dx < len(row) and row[dx] != -1
+            if filled and run_start is None:
+                run_start = dx
+            elif not filled and run_start is not None:
+                runs.append((run_start, dx - run_start))
+                run_start = None
+        if run_start is not None:
+            runs.append((run_start, width - run_start))
+        rows.append(tuple(runs))
+    return tuple(rows)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_tile_offsets(tileset: int, obj_type: int, width: int, height: int) -> tuple:
+    """
+    Memoized (dx, dy) offsets of the filled and empty tiles of an object.
+    
+    Derived from _cached_tile_runs, so callers can place a whole object with
+    one comprehension instead of testing every tile.
+    
+    Returns:
+        (filled, empty) tuples of (dx, dy) offsets, in row-major order
+    """
+    filled = []
+    empty = []
+    for dy, runs in enumerate(_cached_tile_runs(tileset, obj_type, width, height)):
+        next_dx = 0
+        for run_dx, run_len in runs:
+            empty.extend((dx, dy) for dx in range(next_dx, run_dx))
+            filled.extend((dx, dy) for dx in range(run_dx, run_dx + run_len))
+            next_dx = run_dx + run_len
+        empty.extend((dx, dy) for dx in range(next_dx, width))
+    return tuple(filled), tuple(empty)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_packed_offsets(tileset: int, obj_type: int, width: int, height: int) -> tuple:
+    """
+    Memoized filled-tile offsets of an object, packed like pack_tile_key.
+    
+    Level coordinates are never negative, so the packed key of a tile is the
+    packed key of the object's origin plus one of these offsets.
+    
+    Returns:
+        Tuple of (dy << 24) + dx offsets of the filled tiles
+    """
+    filled, _ = _cached_tile_offsets(tileset, obj_type, width, height)
+    return tuple([(dy << 24) + dx for dx, dy in filled])
+
+
+def _object_tiles(tileset: int, obj_type: int, x: int, y: int, width: int, height: int,
+                  layer: int) -> tuple:
+    """
+    Object database keys of one placed object (memoized as _cached_object_tiles).
+    
+    Arguments are an object signature (see _OBJECT_SIGNATURE) plus its layer,
+    so an object that is unchanged between database rebuilds costs a single
+    cache hit instead of generating its keys again.
+    
+    Returns:
+        (filled, empty) tuples: (x, y, layer) database keys, and empty
+        positions packed with pack_tile_key
+    """
+    filled, empty = _cached_tile_offsets(tileset, obj_type, width, height)
+    if not empty:
+        # Solid object (the common case): every tile in its bounds is
+        # filled, so the keys are a plain product
+        return tuple(itertools.product(range(x, x + width), range(y, y + height), (layer,))), ()
+    return (tuple([(x + dx, y + dy, layer) for dx, dy in filled]),
+            tuple([pack_tile_key(x + dx, y + dy, layer) for dx, dy in empty]))
+
+
+# Entries are per placed object, and every rebuild looks up all objects of the
+# level in the same order; see _fit_object_tiles_cache
+_cached_object_tiles = functools.lru_cache(maxsize=16384)(_object_tiles)
+
+
+def _fit_object_tiles_cache(object_count: int):
+    """
+    Grow _cached_object_tiles so a level with object_count objects fits in it.
+    
+    A level larger than the cache would make every rebuild evict each entry
+    before its next use (so every lookup misses). The new size leaves room for
+    as many objects again, so objects edited between rebuilds push out stale
+    entries rather than the ones of unchanged objects.
+    
+    Args:
+        object_count: Number of objects on all layers of the level
+    """
+    global _cached_object_tiles
+    if object_count * 2 > _cached_object_tiles.cache_info().maxsize:
+        maxsize = 1 << (object_count * 2 - 1).bit_length()
+        _cached_object_tiles = functools.lru_cache(maxsize=maxsize)(_object_tiles)
+
+
+def _validate_render_cache() -> bool:
+    """
+    Clear the RenderObject cache if any tileset's object definitions were swapped.
+    
+    Returns:
+        True if the cache was cleared
+    """
+    global _render_cache_defs
+    
+    defs = _imports().globals_.ObjectDefinitions or []
+    cached = _render_cache_defs
+    if (cached is None or len(cached) != len(defs) or
+            any(old is not new for old, new in zip(cached, defs))):
+        _cached_tile_runs.cache_clear()
+        _cached_tile_offsets.cache_clear()
+        _cached_packed_offsets.cache_clear()
+        _cached_object_tiles.cache_clear()
+        # Keep references so the identity check cannot be fooled by reused ids
+        _render_cache_defs = list(defs)
+        return True
+    return False
+
+
+def _flood_fill_region(occupied: bytearray, zone_w: int, zone_h: int, start: int, limit: int,
+                       blocked: Optional[bytearray] = None):
+    """
+    Flood-fill the empty region containing a cell of a zone bitmap.
+    
+    Works on flat indices (y * zone_w + x) into the occupied bitmap, so no
+    coordinate tuples are built while walking the region. Leaving the zone
+    is treated as a boundary, and the zone edges the region touches are
+    reported so the caller can decide whether the region is enclosed.
+    
+    Args:
+        occupied: Zone-sized bitmap, non-zero where terrain is
+        zone_w, zone_h: Zone dimensions
+        start: Flat index of an empty cell to start from
+        limit: Abort once more than this many cells were filled
+        blocked: Optional zone-sized bitmap of cells not to enter, at least
+            covering occupied; cells reached by this fill are marked in it.
+            If the fill is too large it stops with only part of the region
+            (filled cells plus the queued frontier) marked, so the bitmap
+            must not be reused as walls for another fill after that
+    
+    Returns:
+        (cells, (left, right, top, bottom), too_large) where cells is the
+        list of filled flat indices
+    """
+    cells = []
+    if blocked is None:
+        blocked = bytearray(occupied)
+    if occupied[start]:
+        return cells, (False, False, False, False), False
+    blocked[start] = 1
+    queue = deque([start])
+    pop = queue.popleft
+    push = queue.append
+    touches_left = touches_right = touches_top = touches_bottom = False
+    
+    # Terrain and already queued cells share one bitmap, so each neighbor
+    # costs a single lookup; the four directions are unrolled with their
+    # zone-edge checks done on the flat index
+    last_col = zone_w - 1
+    bottom_row = zone_w * zone_h - zone_w
+    
+    while queue:
+        if len(cells) > limit:
+            return cells, (touches_left, touches_right, touches_top, touches_bottom), True
+        
+        index = pop()
+        cells.append(index)
+        x = index % zone_w
+        
+        if index < bottom_row:
+            neighbor = index + zone_w
+            if not blocked[neighbor]:
+                blocked[neighbor] = 1
+                push(neighbor)
+        else:
+            touches_bottom = True
+        
+        if index >= zone_w:
+            neighbor = index - zone_w
+            if not blocked[neighbor]:
+                blocked[neighbor] = 1
+                push(neighbor)
+        else:
+            touches_top = True
+        
+        if x < last_col:
+            neighbor = index + 1
+            if not blocked[neighbor]:
+                blocked[neighbor] = 1
+                push(neighbor)
+        else:
+            touches_right = True
+        
+        if x:
+            neighbor = index - 1
+            if not blocked[neighbor]:
+                blocked[neighbor] = 1
+                push(neighbor)
+        else:
+            touches_left = True
+    
+    return cells, (touches_left, touches_right, touches_top, touches_bottom), len(cells) > limit
+
+
+def _bresenham_line(x0: int, y0: int, x1: int, y1: int, out: Optional[list] = None) -> list:
+    """
+    Tile positions on the line from (x0, y0) to (x1, y1), both ends included.
+    
+    Drags mostly move by a tile or along one axis, so single points and
+    straight lines are built directly; only diagonal segments run the
+    Bresenham stepping loop.
+    
+    Args:
+        out: Optional list to reuse; it is cleared and filled in place
+    
+    Returns:
+        List of (x, y) tuples (``out`` when given)
+    """
+    dx = abs(x1 - x0)
+    dy = abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    
+    if out is None:
+        positions = []
+    else:
+        positions = out
+        positions.clear()
+    
+    if not dy:
+        positions.extend(zip(range(x0, x1 + sx, sx), itertools.repeat(y0, dx + 1)))
+        return positions
+    if not dx:
+        positions.extend(zip(itertools.repeat(x0, dy + 1), range(y0, y1 + sy, sy)))
+        return positions
+    
+    append = positions.append
+    err = dx - dy
+    
+    while True:
+        append((x0, y0))
+        if x0 == x1 and y0 == y1:
+            break
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            x0 += sx
+        if e2 < dx:
+            err += dx
+            y0 += sy
+    
+    return positions
+
+
+class _deferred_scene_updates:
+    """
+    Blocks a scene's signals while a batch of objects is created or removed,
+    then issues a single update once the batch is done.
+    
+    The level scene normally runs without an item index; if one is active,
+    it is switched off for the batch so it is rebuilt once at the end rather
+    than updated per item.
+    
+    Removing an item deselects it, and the selectionChanged signal for that
+    is blocked along with the rest; it is emitted once at the end if the
+    selection differs, so the main window never keeps a removed item selected.
+    """
+    
+    def __init__(self, scene):
+        self.scene = scene
+        self.was_blocked = False
+        self.index_method = None
+        self.selected = None
+    
+    def __enter__(self):
+        self.selected = set(self.scene.selectedItems())
+        self.was_blocked = self.scene.blockSignals(True)
+        no_index = QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex
+        index_method = self.scene.itemIndexMethod()
+        if index_method != no_index:
+            self.index_method = index_method
+            self.scene.setItemIndexMethod(no_index)
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.index_method is not None:
+            self.scene.setItemIndexMethod(self.index_method)
+            self.index_method = None
+        self.scene.blockSignals(self.was_blocked)
+        if not self.was_blocked and set(self.scene.selectedItems()) != self.selected:
+            self.scene.selectionChanged.emit()
+        self.selected = None
+        self.scene.update()
+        return False
+
+
+def _set_view_cursor(view, shape: QtCore.Qt.CursorShape):
+    """
+    Set the canvas cursor, skipping the call when it already has that shape.
+
+    The current shape is read back from the view rather than remembered, since
+    the fill tabs also set the view's cursor (e.g. ForbiddenCursor over walls).
+
+    Args:
+        view: Graphics view of the main window
+        shape: Cursor shape to show
+    """
+    if view.cursor().shape() != shape:
+        view.setCursor(shape)
+
+
+def _greedy_rectangles(positions) -> array:
+    """
+    Cover a set of tile positions with as few rectangles as practical.
+    
+    Rasterizes the positions into a bitmap over their bounding box and scans
+    it row by row: each uncovered cell starts a rectangle that grows right
+    along its run, then down while the whole run stays set. Covered cells
+    are cleared, so every position ends up in exactly one rectangle.
+    
+    Args:
+        positions: Iterable of (x, y) tile coordinates
+    
+    Returns:
+        Flat array of x, y, width, height quadruples (one per rectangle)
+    """
+    rectangles = array('i')
+    positions = list(positions)
+    if not positions:
+        return rectangles
+    
+    min_x = min(p[0] for p in positions)
+    min_y = min(p[1] for p in positions)
+    width = max(p[0] for p in positions) - min_x + 1
+    height = max(p[1] for p in positions) - min_y + 1
+    
+    mask = bytearray(width * height)
+    for x, y in positions:
+        mask[(y - min_y) * width + (x - min_x)] = 1
+    
+    for row in range(height):
+        row_start = row * width
+        col = mask.find(1, row_start, row_start + width)
+        while col != -1:
+            # Extend right along the run
+            run_end = mask.find(0, col, row_start + width)
+            if run_end == -1:
+                run_end = row_start + width
+            run_len = run_end - col
+            run = b'\x01' * run_len
+            
+            # Extend down while the full run is set in the next row
+            rows = 1
+            below = col + width
+            while row + rows < height and mask[below:below + run_len] == run:
+                rows += 1
+                below += width
+            
+            clear = bytes(run_len)
+            for offset in range(col, below, width):
+                mask[offset:offset + run_len] = clear
+            
+            rectangles.extend((min_x + col - row_start, min_y + row, run_len, rows))
+            col = mask.find(1, run_end, row_start + width)
+    
+    return rectangles
+
+
+def _random_order(items: list):
+    """
+    Yield the items of a list in random order, shuffling lazily.
+    
+    A Fisher-Yates shuffle that only swaps as far as the caller consumes, so
+    taking a few items from a large list costs a few steps instead of a
+    full shuffle. The list is permuted in place.
+    """
+    count = len(items)
+    randrange = random.randrange
+    for i in range(count):
+        j = randrange(i, count)
+        items[i], items[j] = items[j], items[i]
+        yield items[i]
+
+
+def _deco_fit_positions(fill_positions, obj_width: int, obj_height: int, usable) -> list:
+    """
+    Positions where a deco object of the given size fits entirely on usable cells.
+    
+    Each fill cell is tested once and recorded as a bit in a per-row int
+    bitmask over the fill bounding box. The masks are then eroded with
+    whole-row shifts and ANDs (object width across, object height down), so
+    the fit of every anchor is computed by a handful of big-int operations
+    per row instead of per-cell Python work. A set bit in the eroded row
+    marks an anchor whose whole footprint is usable.
+    
+    Args:
+        fill_positions: Iterable of (x, y) fill cells
+        obj_width, obj_height: Deco object size in tiles
+        usable: Callable (x, y) -> bool for a fill cell
+    
+    Returns:
+        List of (x, y) top-left positions, in fill_positions order
+    """
+    usable_cells = [p for p in fill_positions if usable(p[0], p[1])]
+    if not usable_cells or (obj_width == 1 and obj_height == 1):
+        return usable_cells
+    
+    min_x = min(p[0] for p in usable_cells)
+    min_y = min(p[1] for p in usable_cells)
+    zone_h = max(p[1] for p in usable_cells) - min_y + 1
+    
+    rows = [0] * zone_h
+    for x, y in usable_cells:
+        rows[y - min_y] |= 1 << (x - min_x)
+    
+    # Bit c of a row: cells c .. c + obj_width - 1 are all usable
+    if obj_width > 1:
+        eroded = []
+        for bits in rows:
+            fit = bits
+            for shift in range(1, obj_width):
+                fit &= bits >> shift
+            eroded.append(fit)
+        rows = eroded
+    
+    # Bit c of a row: the object anchored at (c, row) fits (rows past the
+    # bottom count as unusable)
+    if obj_height > 1:
+        rows = [functools.reduce(operator.and_, rows[row:row + obj_height])
+                if row + obj_height <= zone_h else 0
+                for row in range(zone_h)]
+    
+    return [(x, y) for x, y in usable_cells if (rows[y - min_y] >> (x - min_x)) & 1]
+
+
 class QuickPaintTab(QtWidgets.QWidget):
     """
     Quick Paint Tab for Reggie sidebar.
@@ -37,42 +627,50 @@ class QuickPaintTab(QtWidgets.QWidget):
         init_logging()
         
         # Import here to avoid QWidget creation before QApplication is ready
-        print("[QPT] Importing PresetManager...")
-        from reggie.plugins.quickpaint.core.presets import PresetManager
-        print("[QPT] OK: PresetManager imported")
-        
-        print("[QPT] Importing MouseEventHandler...")
-        from reggie.plugins.quickpaint.ui.events import MouseEventHandler
-        print("[QPT] OK: MouseEventHandler imported")
+        widgets = _widgets()
         
         print("[QPT] Creating preset manager...")
         # PresetManager requires builtin and user directories
         import os
         builtin_dir = os.path.join('assets', 'qpt', 'builtin')
         user_dir = os.path.join('assets', 'qpt', 'presets')
-        self.preset_manager = PresetManager(builtin_dir, user_dir)
+        self.preset_manager = widgets.PresetManager(builtin_dir, user_dir)
         print("[QPT] OK: Preset manager created")
         
         print("[QPT] Creating mouse handler...")
-        self.mouse_handler = MouseEventHandler()
+        self.mouse_handler = widgets.MouseEventHandler()
         print("[QPT] OK: Mouse handler created")
         
+        # Fill Paint tab of the owning palette (set by the palette, or
+        # resolved once through the parent chain on first use)
+        self._fill_tab_ref = None
+        
+        # Spatial index of level objects, only alive while a stroke is placed
+        # (layer -> {bucket: {obj: None}}, buckets keep layer order); None
+        # means fall back to a linear scan
+        self._spatial = None
+        
+        # Interpolated drag positions, refilled in place on every move event
+        self._interp_buf = []
+        
         print("[QPT] Initializing UI...")
         self.init_ui()
         print("[QPT] OK: QuickPaintTab initialized")
     
     def init_ui(self):
-        """Initialize the UI"""
-        print("[QPT] init_ui starting...")
+        """
+        Initialize the UI shell.
         
-        # Import here to avoid QWidget creation before QApplication is ready
-        print("[QPT] Importing TilesetSelector...")
-        from reggie.plugins.quickpaint.ui.tileset_selector import TilesetSelector
-        print("[QPT] OK: TilesetSelector imported")
+        Only the layout, scroll area and a placeholder are built here so the
+        tab shows up immediately; the tileset selector and QuickPaintWidget
+        are mounted by _init_ui_deferred() on the next event loop pass (or
+        earlier, as soon as something accesses them).
+        """
+        print("[QPT] init_ui starting...")
         
-        print("[QPT] Importing QuickPaintWidget...")
-        from reggie.plugins.quickpaint.ui.widget import QuickPaintWidget
-        print("[QPT] OK: QuickPaintWidget imported")
+        self._qpt_widget = None
+        self._tileset_selector = None
+        self._ui_ready_callbacks = []
         
         print("[QPT] Creating layout...")
         layout = QtWidgets.QVBoxLayout(self)
@@ -87,53 +685,145 @@ class QuickPaintTab(QtWidgets.QWidget):
         scroll_area.setStyleSheet("QScrollArea { border: none; }")
         
         # Container widget for scroll area
-        container = QtWidgets.QWidget()
-        container_layout = QtWidgets.QVBoxLayout(container)
-        container_layout.setContentsMargins(0, 0, 0, 0)
-        container_layout.setSpacing(0)
+        self._container = QtWidgets.QWidget()
+        self._container_layout = QtWidgets.QVBoxLayout(self._container)
+        self._container_layout.setContentsMargins(0, 0, 0, 0)
+        self._container_layout.setSpacing(0)
         
-        # ===== TILESET SELECTOR =====
-        print("[QPT] Creating TilesetSelector...")
-        self.tileset_selector = TilesetSelector()
-        container_layout.addWidget(self.tileset_selector)
-        print("[QPT] TilesetSelector created")
-        
-        # ===== SEPARATOR =====
-        print("[QPT] Creating separator...")
-        separator = QtWidgets.QFrame()
-        separator.setFrameShape(QtWidgets.QFrame.Shape.HLine)
-        separator.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
-        container_layout.addWidget(separator)
-        print("[QPT] Separator created")
-        
-        # ===== QUICK PAINT WIDGET =====
-        print("[QPT] Creating QuickPaintWidget...")
-        self.qpt_widget = QuickPaintWidget(self.preset_manager, tileset_selector=self.tileset_selector)
-        print("[QPT] QuickPaintWidget created")
-        container_layout.addWidget(self.qpt_widget)
+        # ===== PLACEHOLDER (replaced once the real widgets are mounted) =====
+        self._placeholder = QtWidgets.QLabel("Loading Quick Paint...")
+        self._placeholder.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self._container_layout.addWidget(self._placeholder)
         
         # Add container to scroll area
-        scroll_area.setWidget(container)
+        scroll_area.setWidget(self._container)
         layout.addWidget(scroll_area)
         print("[QPT] Scroll area created")
         
         # ===== CONNECT SIGNALS =====
-        self.qpt_widget.painting_started.connect(self.on_painting_started)
-        self.qpt_widget.painting_stopped.connect(self.on_painting_stopped)
-        self.qpt_widget.mode_changed.connect(self.on_mode_changed)
-        self.tileset_selector.object_selected.connect(self.on_object_selected)
         self.mouse_handler.painting_ended.connect(self.on_painting_ended)
         self.mouse_handler.object_placed.connect(self.on_object_placed)
-        self.mouse_handler.outline_updated.connect(self.on_outline_updated)
         
-        # Initialize tileset objects after a short delay to ensure Reggie is fully loaded
-        QtCore.QTimer.singleShot(100, self.tileset_selector.initialize_objects)
+        # SmartPaint mouse event handlers, by event type
+        self._smart_dispatch = {
+            "press": self._smart_press,
+            "move": self._smart_move,
+            "release": self.mouse_handler.on_mouse_release,
+        }
+        self._update_outline_fn = None
+        
+        # (area, level edit generation, engine database revision) of the last
+        # object database refresh
+        self._db_cache = None
+        
+        # Outline updates arrive at mouse-move rate; coalesce them so the
+        # preview is redrawn at most once per frame (~60 Hz)
+        self._pending_outline = None
+        self._outline_timer = QtCore.QTimer(self)
+        self._outline_timer.setSingleShot(True)
+        self._outline_timer.setInterval(16)
+        self._outline_timer.timeout.connect(self._flush_outline)
+        self.mouse_handler.outline_updated.connect(self._queue_outline)
+        
+        # Object selections arrive per item while the list is scrubbed; only
+        # the last one within 50 ms configures the brush and canvas
+        self._pending_selection = None
+        self._selection_timer = QtCore.QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(50)
+        self._selection_timer.timeout.connect(self._apply_pending_selection)
+        
+        # Mount the heavy widgets after the first paint
+        QtCore.QTimer.singleShot(0, self._init_ui_deferred)
+    
+    def _init_ui_deferred(self):
+        """Build the tileset selector and QuickPaintWidget (runs only once)"""
+        if self._qpt_widget is not None:
+            return
+        
+        print("[QPT] Mounting deferred QPT widgets...")
+        
+        widgets = _widgets()
+        
+        container_layout = self._container_layout
+        self._container.setUpdatesEnabled(False)
+        try:
+            container_layout.removeWidget(self._placeholder)
+            self._placeholder.deleteLater()
+            self._placeholder = None
+            
+            # ===== TILESET SELECTOR =====
+            print("[QPT] Creating TilesetSelector...")
+            self._tileset_selector = widgets.TilesetSelector()
+            container_layout.addWidget(self._tileset_selector)
+            print("[QPT] TilesetSelector created")
+            
+            # ===== SEPARATOR =====
+            print("[QPT] Creating separator...")
+            separator = QtWidgets.QFrame()
+            separator.setFrameShape(QtWidgets.QFrame.Shape.HLine)
+            separator.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+            container_layout.addWidget(separator)
+            print("[QPT] Separator created")
+            
+            # ===== QUICK PAINT WIDGET =====
+            print("[QPT] Creating QuickPaintWidget...")
+            self._qpt_widget = widgets.QuickPaintWidget(self.preset_manager, tileset_selector=self._tileset_selector)
+            print("[QPT] QuickPaintWidget created")
+            container_layout.addWidget(self._qpt_widget)
+        finally:
+            self._container.setUpdatesEnabled(True)
+        
+        # ===== CONNECT SIGNALS =====
+        self._qpt_widget.painting_started.connect(self.on_painting_started)
+        self._qpt_widget.painting_stopped.connect(self.on_painting_stopped)
+        self._qpt_widget.mode_changed.connect(self.on_mode_changed)
+        self._tileset_selector.object_selected.connect(self.on_object_selected)
+        
+        # Initialize tileset objects after a short delay to ensure Reggie is
+        # fully loaded, then try to auto-load a preset for the current tileset
+        QtCore.QTimer.singleShot(100, self._initialize_tileset_state)
+        
+        callbacks, self._ui_ready_callbacks = self._ui_ready_callbacks, []
+        for callback in callbacks:
+            callback(self)
+    
+    def _initialize_tileset_state(self):
+        """Load the tileset objects, then the preset for the current tileset"""
+        self._tileset_selector.initialize_objects()
+        self._qpt_widget.initialize_with_current_tileset()
+    
+    @property
+    def qpt_widget(self):
+        """The QuickPaintWidget, mounted on first access if still deferred"""
+        if self._qpt_widget is None:
+            self._init_ui_deferred()
+        return self._qpt_widget
+    
+    @property
+    def tileset_selector(self):
+        """The TilesetSelector, mounted on first access if still deferred"""
+        if self._tileset_selector is None:
+            self._init_ui_deferred()
+        return self._tileset_selector
+    
+    def when_ui_ready(self, callback):
+        """
+        Run a callback once the deferred widgets are mounted.
         
-        # Try to auto-load a preset for the current tileset after initialization
-        QtCore.QTimer.singleShot(200, self.qpt_widget.initialize_with_current_tileset)
+        Args:
+            callback: Called with this tab; immediately if already mounted
+        """
+        if self._qpt_widget is not None:
+            callback(self)
+        else:
+            self._ui_ready_callbacks.append(callback)
     
     def on_painting_started(self):
         """Handle painting start"""
+        # Make sure a selection still waiting on the debounce is applied
+        self._apply_pending_selection()
+        
         brush = self.qpt_widget.get_current_brush()
         mode = self.qpt_widget.get_current_mode()
         layer = self.qpt_widget.get_current_layer()
@@ -154,7 +844,7 @@ class QuickPaintTab(QtWidgets.QWidget):
     
     def on_mode_changed(self, mode: str):
         """Handle painting mode change from the widget combobox"""
-        from reggie.plugins.quickpaint.core.tool_manager import get_tool_manager, ToolType
+        from reggie.plugins.quickpaint.core.tool_manager import get_tool_manager
         
         tool_manager = get_tool_manager()
         mode_to_tool = {
@@ -172,11 +862,24 @@ class QuickPaintTab(QtWidgets.QWidget):
         """
         Handle object selection from tileset.
         
+        The selection is debounced; see _apply_pending_selection().
+        
         Args:
             tileset: Tileset index
             obj_type: Object type
             obj_id: Object ID
         """
+        self._pending_selection = (tileset, obj_type, obj_id)
+        self._selection_timer.start()
+    
+    def _apply_pending_selection(self):
+        """Apply the most recent object selection, if one is pending"""
+        if self._pending_selection is None:
+            return
+        self._selection_timer.stop()
+        tileset, obj_type, obj_id = self._pending_selection
+        self._pending_selection = None
+        
         print(f"[QPT] on_object_selected called: tileset={tileset}, obj_type={obj_type}, obj_id={obj_id}")
         
         # Update selected tile for Single Tile mode
@@ -209,54 +912,65 @@ class QuickPaintTab(QtWidgets.QWidget):
         Args:
             placements: List of ObjectPlacement objects
         """
-        print(f"[QPT] on_painting_ended: {len(placements)} placements")
+        debug = log_enabled()
+        if debug:
+            log(f"on_painting_ended: {len(placements)} placements")
         
         # Get reference to Reggie's main window
         try:
-            from reggie.core import globals_
-            main_window = globals_.mainWindow
+            lazy = _imports()
+            main_window = lazy.globals_.mainWindow
             
             if main_window and placements:
-                from reggie.core import undo as undo_module
-                with undo_module.bulk_edit_session('Quick Paint stroke'):
-                    # Apply cross-stroke merge deletions FIRST (before creating new objects)
-                    # This prevents splitting of newly created merged objects
-                    engine = self.mouse_handler.engine
-                    merge_deletes = engine.get_pending_merge_deletes()
-                    for x, y, layer in merge_deletes:
-                        self._delete_tile_at(x, y, layer)
-
-                    for placement in placements:
-                        # For terrain-aware replacements, delete existing tile first
-                        # This handles the case where we're replacing a border with center
-                        self._delete_tile_at(placement.x, placement.y, placement.layer)
-
-                        # Create the object in the level
-                        main_window.CreateObject(
-                            tileset=placement.tileset,
-                            object_num=placement.object_id,
-                            layer=placement.layer,
-                            x=placement.x,
-                            y=placement.y,
-                            width=placement.width,
-                            height=placement.height
-                        )
-                print(f"[QPT] OK: Created {len(placements)} objects in level")
-                
-                # Schedule terrain-aware deletions after 100ms delay
-                from PyQt6.QtCore import QTimer
-                QTimer.singleShot(100, self._apply_terrain_aware_deletes)
+                self._spatial = {}
+                try:
+                    with lazy.undo_module.bulk_edit_session('Quick Paint stroke'), \
+                            _deferred_scene_updates(main_window.scene):
+                        # Apply all deletions FIRST (before creating new objects):
+                        # cross-stroke merge deletions, plus the tile under each
+                        # placement for terrain-aware replacements (e.g. a border
+                        # replaced with center). This prevents splitting of newly
+                        # created merged objects; positions shared by both are
+                        # only deleted once.
+                        engine = self.mouse_handler.engine
+                        to_delete = dict.fromkeys(engine.get_pending_merge_deletes())
+                        for placement in placements:
+                            to_delete[(placement.x, placement.y, placement.layer)] = None
+                        for x, y, layer in to_delete:
+                            self._delete_tile_at(x, y, layer)
+
+                        for placement in placements:
+                            # Create the object in the level
+                            obj = main_window.CreateObject(
+                                tileset=placement.tileset,
+                                object_num=placement.object_id,
+                                layer=placement.layer,
+                                x=placement.x,
+                                y=placement.y,
+                                width=placement.width,
+                                height=placement.height
+                            )
+                            self._spatial_add(placement.layer, obj)
+                finally:
+                    self._spatial = None
+                if debug:
+                    log(f"OK: Created {len(placements)} objects in level")
                 
                 # Capture tile types NOW before session resets (session resets on next paint start)
+                tile_types_snapshot = None
                 try:
                     engine = self.mouse_handler.engine
-                    tile_types_snapshot = dict(engine.session.outline_tile_types) if engine.session else {}
-                    print(f"[QPT] Auto-fill: Captured {len(tile_types_snapshot)} tile types, scheduling check...")
-                    
-                    # Schedule auto-fill check after terrain is fully placed (250ms)
-                    QTimer.singleShot(250, lambda: self._try_auto_fill_closed_polygon(placements, tile_types_snapshot))
+                    # Read-only view instead of a copy; the session swaps in a
+                    # new dict on reset, so this one is no longer written to
+                    tile_types_snapshot = types.MappingProxyType(engine.session.outline_tile_types) if engine.session else {}
+                    if debug:
+                        log(f"Auto-fill: Captured {len(tile_types_snapshot)} tile types, scheduling check...")
                 except Exception as e2:
                     print(f"[QPT] Auto-fill snapshot error: {e2}")
+                
+                # Terrain-aware deletions and the auto-fill check run from one
+                # timer after a 100ms delay (kept for visual distinction)
+                QtCore.QTimer.singleShot(100, lambda: self._finish_stroke(placements, tile_types_snapshot))
         except Exception as e:
             print(f"[QPT] Error placing objects: {e}")
     
@@ -268,12 +982,11 @@ class QuickPaintTab(QtWidgets.QWidget):
             placement: ObjectPlacement object
         """
         try:
-            from reggie.core import globals_
-            main_window = globals_.mainWindow
+            lazy = _imports()
+            main_window = lazy.globals_.mainWindow
             
             if main_window and placement:
-                from reggie.core import undo as undo_module
-                with undo_module.bulk_edit_session('Quick Paint stroke'):
+                with lazy.undo_module.bulk_edit_session('Quick Paint stroke'):
                     main_window.CreateObject(
                         tileset=placement.tileset,
                         object_num=placement.object_id,
@@ -287,15 +1000,27 @@ class QuickPaintTab(QtWidgets.QWidget):
         except Exception as e:
             print(f"[QPT] Error placing object: {e}")
     
+    def _finish_stroke(self, placements, tile_types_snapshot):
+        """
+        Run the deferred follow-up work of a stroke, in order.
+        
+        Args:
+            placements: List of ObjectPlacement objects from the stroke
+            tile_types_snapshot: Tile types captured at paint end, or None if
+                the capture failed (auto-fill is skipped then)
+        """
+        self._apply_terrain_aware_deletes()
+        # Deletes are applied synchronously, so the terrain is final here
+        if tile_types_snapshot is not None:
+            self._try_auto_fill_closed_polygon(placements, tile_types_snapshot)
+    
     def _apply_terrain_aware_deletes(self):
         """
         Apply pending terrain-aware deletions.
         Called after a 100ms delay for visual distinction.
         """
         try:
-            from reggie.core import globals_
-            from reggie.plugins.quickpaint.reggie_hook import apply_terrain_aware_deletes
-            apply_terrain_aware_deletes()
+            _imports().apply_terrain_aware_deletes()
         except Exception as e:
             print(f"[QPT] Error applying terrain-aware deletes: {e}")
     
@@ -309,25 +1034,21 @@ class QuickPaintTab(QtWidgets.QWidget):
         
         Args:
             placements: List of ObjectPlacement objects from the paint operation
-            tile_types_snapshot: Dict of (x,y) -> tile_type captured at paint time
+            tile_types_snapshot: Mapping of (x,y) -> tile_type captured at paint time
         """
+        debug = log_enabled()
         try:
-            from reggie.core import globals_
-            from collections import deque
-            from reggie.core.dirty import SetDirty
+            lazy = _imports()
+            globals_ = lazy.globals_
             
             if not globals_.Area or not globals_.mainWindow:
                 return
             
             # Get the fill object from the FillPaintTab (via parent palette)
-            palette = self.parent()
-            while palette and not hasattr(palette, 'fill_paint_tab'):
-                palette = palette.parent()
-            
-            if not palette or not hasattr(palette, 'fill_paint_tab'):
+            fill_tab = self._fill_tab_ref or self._resolve_fill_tab()
+            if fill_tab is None:
                 return
             
-            fill_tab = palette.fill_paint_tab
             fill_object_id = fill_tab._fill_object_id
             fill_tileset = fill_tab._tileset_idx
             
@@ -337,20 +1058,6 @@ class QuickPaintTab(QtWidgets.QWidget):
             # Get the layer from the Fill Paint tab's layer selector
             layer = fill_tab.get_current_layer()
             
-            # Build set of all occupied positions on this layer
-            # Use RenderObject to detect empty tiles in slope objects
-            from reggie.core.tiles import RenderObject
-            occupied = set()
-            layer_obj = globals_.Area.layers[layer]
-            for obj in layer_obj:
-                tile_array = RenderObject(obj.tileset, obj.type, obj.width, obj.height)
-                for dy in range(obj.height):
-                    for dx in range(obj.width):
-                        # Check if this tile is actually filled (not -1)
-                        tile_value = tile_array[dy][dx] if dy < len(tile_array) and dx < len(tile_array[dy]) else -1
-                        if tile_value != -1:
-                            occupied.add((obj.objx + dx, obj.objy + dy))
-            
             # Get zone bounds for the painted area
             if not placements:
                 return
@@ -391,48 +1098,69 @@ class QuickPaintTab(QtWidgets.QWidget):
             zone_max_x = zone_x + zone_w
             zone_max_y = zone_y + zone_h
             
+            # Build a bitmap of occupied positions inside the zone, indexed by
+            # (y - zone_y) * zone_w + (x - zone_x). Only in-zone cells are ever
+            # looked up, so membership becomes a plain byte index.
+            # Use RenderObject to detect empty tiles in slope objects
+            _validate_render_cache()
+            occupied = bytearray(zone_w * zone_h)
+            layer_obj = globals_.Area.layers[layer]
+            for obj in layer_obj:
+                obj_x, obj_y = obj.objx, obj.objy
+                if (obj_x >= zone_max_x or obj_x + obj.width <= zone_x or
+                        obj_y >= zone_max_y or obj_y + obj.height <= zone_y):
+                    continue
+                row_runs = _cached_tile_runs(obj.tileset, obj.type, obj.width, obj.height)
+                for dy, runs in enumerate(row_runs):
+                    oy = obj_y + dy
+                    if not zone_y <= oy < zone_max_y:
+                        continue
+                    row_base = (oy - zone_y) * zone_w - zone_x
+                    for run_dx, run_len in runs:
+                        # Clip the run to the zone and mark it with one slice write
+                        x0 = max(obj_x + run_dx, zone_x)
+                        x1 = min(obj_x + run_dx + run_len, zone_max_x)
+                        if x0 < x1:
+                            occupied[row_base + x0:row_base + x1] = b'\x01' * (x1 - x0)
+            
+            # Terrain touches a zone edge if any cell of that edge's row or
+            # column is occupied; read straight off the bitmap
+            terrain_touches_left = 1 in occupied[::zone_w]
+            terrain_touches_right = 1 in occupied[zone_w - 1::zone_w]
+            terrain_touches_top = 1 in occupied[:zone_w]
+            terrain_touches_bottom = 1 in occupied[-zone_w:]
+            
             # Collect candidate interior points from the newly placed terrain
             # For each placement, check the "inside" direction based on tile type
-            inside_offsets = {
-                'top': (0, 1),       # Inside is below
-                'bottom': (0, -1),   # Inside is above
-                'left': (1, 0),      # Inside is to the right
-                'right': (-1, 0),    # Inside is to the left
-                'top_left': (1, 1),
-                'top_right': (-1, 1),
-                'bottom_left': (1, -1),
-                'bottom_right': (-1, -1),
-                'inner_top_left': (-1, -1),
-                'inner_top_right': (1, -1),
-                'inner_bottom_left': (-1, 1),
-                'inner_bottom_right': (1, 1),
-            }
+            inside_offsets = _INSIDE_OFFSETS
             
             # Get tile types from the snapshot (captured before session reset)
             # For merged placements (width>1 or height>1), check all covered positions
             candidates = set()
             
-            print(f"[QPT] Auto-fill: {len(placements)} placements, {len(tile_types_snapshot)} tile types, zone=({zone_x},{zone_y})-({zone_max_x},{zone_max_y})")
+            if debug:
+                log(f"Auto-fill: {len(placements)} placements, {len(tile_types_snapshot)} tile types, zone=({zone_x},{zone_y})-({zone_max_x},{zone_max_y})")
             
             for placement in placements:
                 for pdy in range(placement.height):
                     for pdx in range(placement.width):
                         px, py = placement.x + pdx, placement.y + pdy
-                        pos = (px, py)
-                        tile_type = tile_types_snapshot.get(pos)
-                        if tile_type and tile_type in inside_offsets:
-                            dx, dy = inside_offsets[tile_type]
-                            interior_x = px + dx
-                            interior_y = py + dy
-                            if (interior_x, interior_y) not in occupied:
-                                if zone_x <= interior_x < zone_max_x and zone_y <= interior_y < zone_max_y:
-                                    candidates.add((interior_x, interior_y))
+                        offset = inside_offsets.get(tile_types_snapshot.get((px, py)))
+                        if offset is None:
+                            continue
+                        interior_x = px + offset[0]
+                        interior_y = py + offset[1]
+                        if zone_x <= interior_x < zone_max_x and zone_y <= interior_y < zone_max_y:
+                            if not occupied[(interior_y - zone_y) * zone_w + (interior_x - zone_x)]:
+                                candidates.add((interior_x, interior_y))
             
             if not candidates:
-                print(f"[QPT] Auto-fill: No interior candidates found")
+                if debug:
+                    log("Auto-fill: No interior candidates found")
                 return
             
-            print(f"[QPT] Auto-fill: {len(candidates)} interior candidates")
+            if debug:
+                log(f"Auto-fill: {len(candidates)} interior candidates")
             
             # Try flood-fill from each candidate to find enclosed areas
             # An area is "enclosed" if bounded by terrain OR zone edges
@@ -440,60 +1168,39 @@ class QuickPaintTab(QtWidgets.QWidget):
             
             already_filled = set()
             
+            # Terrain plus every region a flood fill walked completely so far.
+            # Whether a region is accepted only depends on the region, not on
+            # the start cell, so a candidate inside an already walked region
+            # is skipped outright (candidates are never on terrain)
+            region_visited = bytearray(occupied)
+            # Cells reached by fills that hit MAX_AUTO_FILL. Those fills only
+            # marked part of their region, so they are kept out of
+            # region_visited (a later fill would take that part for walls);
+            # a candidate on one of these cells is in a region known to be too large
+            aborted = bytearray(len(occupied))
+            
             for start_x, start_y in candidates:
-                if (start_x, start_y) in already_filled:
-                    continue
-                if (start_x, start_y) in occupied:
+                start = (start_y - zone_y) * zone_w + (start_x - zone_x)
+                if region_visited[start] or aborted[start]:
                     continue
                 
                 # BFS flood fill - zone edges act as boundaries (not as "unbounded")
                 # But ONLY if terrain also touches those zone edges (closing the polygon)
-                filled = set()
-                queue = deque([(start_x, start_y)])
-                visited = {(start_x, start_y)}
-                # Track which specific zone edges the fill touches
-                fill_touches_left = False
-                fill_touches_right = False
-                fill_touches_top = False
-                fill_touches_bottom = False
-                too_large = False
-                
-                while queue:
-                    if len(filled) > MAX_AUTO_FILL:
-                        too_large = True  # Too large, abort
-                        break
-                    
-                    cx, cy = queue.popleft()
-                    
-                    # Check if outside zone bounds - track which edge and treat as boundary
-                    if cx < zone_x:
-                        fill_touches_left = True
-                        continue
-                    if cx >= zone_max_x:
-                        fill_touches_right = True
-                        continue
-                    if cy < zone_y:
-                        fill_touches_top = True
-                        continue
-                    if cy >= zone_max_y:
-                        fill_touches_bottom = True
-                        continue
-                    
-                    # Check if occupied (this is the terrain boundary)
-                    if (cx, cy) in occupied:
-                        continue
-                    
-                    filled.add((cx, cy))
-                    
-                    # Check 4-connected neighbors
-                    for ndx, ndy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                        nx, ny = cx + ndx, cy + ndy
-                        if (nx, ny) not in visited:
-                            visited.add((nx, ny))
-                            queue.append((nx, ny))
+                blocked = bytearray(region_visited)
+                cells, edges, too_large = _flood_fill_region(
+                    occupied, zone_w, zone_h, start, MAX_AUTO_FILL, blocked)
+                if too_large:
+                    for i in cells:
+                        aborted[i] = 1
+                else:
+                    # The whole region was walked, so blocked now holds it too
+                    region_visited = blocked
+                fill_touches_left, fill_touches_right, fill_touches_top, fill_touches_bottom = edges
+                filled = {(zone_x + i % zone_w, zone_y + i // zone_w) for i in cells}
                 
                 if too_large or not filled:
-                    print(f"[QPT] Auto-fill: Candidate ({start_x},{start_y}) not enclosed (too_large={too_large}, filled={len(filled)})")
+                    if debug:
+                        log(f"Auto-fill: Candidate ({start_x},{start_y}) not enclosed (too_large={too_large}, filled={len(filled)})")
                     continue  # Not enclosed or too large, skip
                 
                 touches_zone_edge = fill_touches_left or fill_touches_right or fill_touches_top or fill_touches_bottom
@@ -502,11 +1209,7 @@ class QuickPaintTab(QtWidgets.QWidget):
                 # This ensures open polygons only fill if zone edge "closes" them
                 if touches_zone_edge and has_zone:
                     # Check if terrain touches the same zone edges that the fill touched
-                    terrain_touches_left = any(x == zone_x for x, y in occupied)
-                    terrain_touches_right = any(x == zone_max_x - 1 for x, y in occupied)
-                    terrain_touches_top = any(y == zone_y for x, y in occupied)
-                    terrain_touches_bottom = any(y == zone_max_y - 1 for x, y in occupied)
-                    
+                    # (flags were computed while building the occupied bitmap)
                     # For each zone edge the fill touched, terrain must also touch it
                     # This ensures the polygon is "closed" by terrain connecting to zone edge
                     invalid_fill = False
@@ -520,115 +1223,56 @@ class QuickPaintTab(QtWidgets.QWidget):
                         invalid_fill = True
                     
                     if invalid_fill:
-                        print(f"[QPT] Auto-fill: Candidate ({start_x},{start_y}) rejected - fill touches zone edge but terrain doesn't connect to it")
-                        print(f"[QPT]   Fill touches: L={fill_touches_left}, R={fill_touches_right}, T={fill_touches_top}, B={fill_touches_bottom}")
-                        print(f"[QPT]   Terrain touches: L={terrain_touches_left}, R={terrain_touches_right}, T={terrain_touches_top}, B={terrain_touches_bottom}")
+                        if debug:
+                            log(f"Auto-fill: Candidate ({start_x},{start_y}) rejected - fill touches zone edge but terrain doesn't connect to it")
+                            log(f"  Fill touches: L={fill_touches_left}, R={fill_touches_right}, T={fill_touches_top}, B={fill_touches_bottom}")
+                            log(f"  Terrain touches: L={terrain_touches_left}, R={terrain_touches_right}, T={terrain_touches_top}, B={terrain_touches_bottom}")
                         continue
                 
-                print(f"[QPT] Auto-fill: Found enclosed area with {len(filled)} tiles (zone_edge={touches_zone_edge})")
+                if debug:
+                    log(f"Auto-fill: Found enclosed area with {len(filled)} tiles (zone_edge={touches_zone_edge})")
                 
                 # Apply overpaint if the fill touches the zone edge (and we have a zone)
                 if touches_zone_edge and has_zone:
                     filled = fill_engine._add_overpaint(filled, zone_x, zone_y, zone_w, zone_h)
-                    print(f"[QPT] Auto-fill: Applied overpaint, now {len(filled)} tiles")
+                    if debug:
+                        log(f"Auto-fill: Applied overpaint, now {len(filled)} tiles")
                 
-                # This is an enclosed area! Auto-fill it with vertical slice merging
+                # This is an enclosed area! Auto-fill it with merged rectangles
                 already_filled.update(filled)
+                rects = _greedy_rectangles(filled)
                 
-                # Step 1: Group positions by column for vertical slice merging
-                columns = {}
-                for fx, fy in filled:
-                    if fx not in columns:
-                        columns[fx] = []
-                    columns[fx].append(fy)
-                
-                # Step 2: Create vertical slices (1-wide columns)
-                vertical_slices = []
-                for col_x, y_values in columns.items():
-                    y_values.sort()
-                    if not y_values:
-                        continue
-                    
-                    run_start = y_values[0]
-                    run_end = y_values[0]
-                    
-                    for i in range(1, len(y_values)):
-                        if y_values[i] == run_end + 1:
-                            run_end = y_values[i]
-                        else:
-                            vertical_slices.append({
-                                'x': col_x, 'y': run_start,
-                                'height': run_end - run_start + 1
-                            })
-                            run_start = y_values[i]
-                            run_end = y_values[i]
-                    
-                    vertical_slices.append({
-                        'x': col_x, 'y': run_start,
-                        'height': run_end - run_start + 1
-                    })
-                
-                # Step 3: Merge horizontally adjacent slices with same y and height
-                slice_groups = {}
-                for s in vertical_slices:
-                    key = (s['y'], s['height'])
-                    if key not in slice_groups:
-                        slice_groups[key] = []
-                    slice_groups[key].append(s)
-                
-                placements = []
-                for (y, height), slices in slice_groups.items():
-                    slices.sort(key=lambda s: s['x'])
-                    run_start_x = slices[0]['x']
-                    run_end_x = slices[0]['x']
-                    
-                    for i in range(1, len(slices)):
-                        if slices[i]['x'] == run_end_x + 1:
-                            run_end_x = slices[i]['x']
-                        else:
-                            placements.append({
-                                'x': run_start_x, 'y': y,
-                                'width': run_end_x - run_start_x + 1, 'height': height
-                            })
-                            run_start_x = slices[i]['x']
-                            run_end_x = slices[i]['x']
-                    
-                    placements.append({
-                        'x': run_start_x, 'y': y,
-                        'width': run_end_x - run_start_x + 1, 'height': height
-                    })
-                
-                # Step 4: Create merged objects as one undo step
-                from reggie.core import undo as undo_module
+                # Create merged objects as one undo step
                 placed_count = 0
-                with undo_module.bulk_edit_session('Quick Paint fill'):
-                    for p in placements:
+                with lazy.undo_module.bulk_edit_session('Quick Paint fill'), \
+                        _deferred_scene_updates(globals_.mainWindow.scene):
+                    for i in range(0, len(rects), 4):
+                        rx, ry, rw, rh = rects[i:i + 4]
                         try:
                             globals_.mainWindow.CreateObject(
                                 fill_tileset,
                                 fill_object_id,
                                 layer,
-                                p['x'], p['y'],
-                                p['width'], p['height']
+                                rx, ry,
+                                rw, rh
                             )
                             placed_count += 1
                         except Exception as e:
-                            print(f"[QPT] Auto-fill error at ({p['x']}, {p['y']}): {e}")
+                            print(f"[QPT] Auto-fill error at ({rx}, {ry}): {e}")
                 
                 if placed_count > 0:
-                    SetDirty()
-                    print(f"[QPT] Auto-fill: Placed {placed_count} merged vertical slices (from {len(filled)} tiles)")
+                    lazy.SetDirty()
+                    if debug:
+                        log(f"Auto-fill: Placed {placed_count} merged rectangles (from {len(filled)} tiles)")
             
             if already_filled:
-                globals_.mainWindow.scene.update()
-                
                 # Auto-apply deco objects if checkbox is enabled in Fill Paint tab
                 try:
-                    fill_tab = globals_.mainWindow.qpt_palette.get_fill_paint_tab()
-                    if fill_tab and fill_tab.auto_deco_checkbox.isChecked():
+                    if fill_tab.auto_deco_checkbox.isChecked():
                         # Convert already_filled set to list for _auto_apply_deco_fills
                         fill_tab._auto_apply_deco_fills(list(already_filled))
-                        print(f"[QPT] Auto-fill: Applied auto-deco to {len(already_filled)} positions")
+                        if debug:
+                            log(f"Auto-fill: Applied auto-deco to {len(already_filled)} positions")
                 except Exception as deco_e:
                     print(f"[QPT] Auto-fill deco error: {deco_e}")
                 
@@ -637,6 +1281,30 @@ class QuickPaintTab(QtWidgets.QWidget):
             import traceback
             traceback.print_exc()
     
+    def set_fill_tab(self, fill_tab):
+        """
+        Set the Fill Paint tab auto-fill reads its fill object from.
+        
+        Args:
+            fill_tab: FillPaintTab of the owning palette
+        """
+        self._fill_tab_ref = fill_tab
+    
+    def _resolve_fill_tab(self):
+        """
+        Find the Fill Paint tab through the parent chain and cache it.
+        
+        Returns:
+            FillPaintTab, or None if this tab is not inside a palette yet
+        """
+        palette = self.parent()
+        while palette and not hasattr(palette, 'fill_paint_tab'):
+            palette = palette.parent()
+        
+        if palette:
+            self._fill_tab_ref = palette.fill_paint_tab
+        return self._fill_tab_ref
+    
     def _delete_tile_at(self, x: int, y: int, layer: int):
         """
         Delete any existing tile at the specified position.
@@ -647,21 +1315,29 @@ class QuickPaintTab(QtWidgets.QWidget):
             layer: Layer to delete from
         """
         try:
-            from reggie.core import globals_
+            lazy = _imports()
+            globals_ = lazy.globals_
             if not globals_.Area:
                 return
             
             layer_obj = globals_.Area.layers[layer]
             
-            # Find objects that cover this position
+            # Find objects that cover this position; during a stroke only the
+            # objects sharing this position's bucket need to be checked
+            if self._spatial is not None:
+                buckets = self._spatial_layer(layer, layer_obj)
+                candidates = buckets.get((x >> _SPATIAL_BUCKET_SHIFT, y >> _SPATIAL_BUCKET_SHIFT), ())
+            else:
+                candidates = layer_obj
+            
             to_process = []
-            for obj in layer_obj:
+            for obj in candidates:
                 if (obj.objx <= x < obj.objx + obj.width and
                     obj.objy <= y < obj.objy + obj.height):
                     to_process.append(obj)
             
             # Process each object
-            from reggie.core import undo as undo_module
+            undo_module = lazy.undo_module
             for obj in to_process:
                 obj_x, obj_y = obj.objx, obj.objy
                 obj_w, obj_h = obj.width, obj.height
@@ -670,32 +1346,93 @@ class QuickPaintTab(QtWidgets.QWidget):
 
                 # Remove the original object (undo-aware)
                 undo_module.bulk_remove_object(obj)
+                self._spatial_discard(layer, obj)
                 
                 # If 1x1, we're done
                 if obj_w == 1 and obj_h == 1:
                     continue
                 
-                # Recreate parts that should remain (all except target position)
-                for dy in range(obj_h):
-                    for dx in range(obj_w):
-                        tile_x = obj_x + dx
-                        tile_y = obj_y + dy
-                        
-                        if tile_x == x and tile_y == y:
-                            continue
-                        
-                        globals_.mainWindow.CreateObject(
-                            tileset=obj_tileset,
-                            object_num=obj_type,
-                            layer=layer,
-                            x=tile_x,
-                            y=tile_y,
-                            width=1,
-                            height=1
-                        )
+                # Recreate parts that should remain (all except target position),
+                # merged into as few rectangles as possible
+                survivors = [
+                    (obj_x + dx, obj_y + dy)
+                    for dy in range(obj_h) for dx in range(obj_w)
+                    if obj_x + dx != x or obj_y + dy != y
+                ]
+                rects = _greedy_rectangles(survivors)
+                for i in range(0, len(rects), 4):
+                    rx, ry, rw, rh = rects[i:i + 4]
+                    piece = globals_.mainWindow.CreateObject(
+                        tileset=obj_tileset,
+                        object_num=obj_type,
+                        layer=layer,
+                        x=rx,
+                        y=ry,
+                        width=rw,
+                        height=rh
+                    )
+                    self._spatial_add(layer, piece)
         except Exception as e:
             print(f"[QPT] Error deleting tile at ({x}, {y}): {e}")
     
+    def _spatial_layer(self, layer: int, layer_obj) -> Dict:
+        """
+        Get the spatial index for a layer, building it on first use.
+        
+        Args:
+            layer: Layer index
+            layer_obj: The layer's object list
+        
+        Returns:
+            Dict mapping bucket coordinates to the objects overlapping it (an
+            insertion-ordered dict used as a set, so layer order is kept)
+        """
+        buckets = self._spatial.get(layer)
+        if buckets is None:
+            buckets = self._spatial[layer] = defaultdict(dict)
+            for obj in layer_obj:
+                self._spatial_add(layer, obj)
+        return buckets
+    
+    def _spatial_add(self, layer: int, obj):
+        """
+        Add an object to every bucket it overlaps (no-op outside a stroke).
+        
+        Args:
+            layer: Layer the object lives on
+            obj: Level object
+        """
+        if self._spatial is None or obj is None:
+            return
+        buckets = self._spatial.get(layer)
+        if buckets is None:
+            # Layer not indexed yet; it will pick the object up when built
+            return
+        shift = _SPATIAL_BUCKET_SHIFT
+        for by in range(obj.objy >> shift, ((obj.objy + obj.height - 1) >> shift) + 1):
+            for bx in range(obj.objx >> shift, ((obj.objx + obj.width - 1) >> shift) + 1):
+                buckets[(bx, by)][obj] = None
+    
+    def _spatial_discard(self, layer: int, obj):
+        """
+        Remove an object from the spatial index (no-op outside a stroke).
+        
+        Args:
+            layer: Layer the object lived on
+            obj: Level object
+        """
+        if self._spatial is None:
+            return
+        buckets = self._spatial.get(layer)
+        if buckets is None:
+            return
+        shift = _SPATIAL_BUCKET_SHIFT
+        for by in range(obj.objy >> shift, ((obj.objy + obj.height - 1) >> shift) + 1):
+            for bx in range(obj.objx >> shift, ((obj.objx + obj.width - 1) >> shift) + 1):
+                bucket = buckets.get((bx, by))
+                if bucket is not None:
+                    bucket.pop(obj, None)
+    
     def _refresh_object_database(self):
         """
         Refresh the object database from the current level.
@@ -704,48 +1441,80 @@ class QuickPaintTab(QtWidgets.QWidget):
         Uses RenderObject to detect empty tiles within slope objects.
         Positions with tile value -1 are empty and NOT added to database.
         Empty slope regions are tracked separately to prevent ghost tiles.
+        
+        Nothing is done when the level was not edited since the last refresh
+        (see dirty.editGeneration) and the engine still holds the database it
+        was handed then.
         """
         try:
-            from reggie.core import globals_
-            from reggie.core.tiles import RenderObject
-            if not globals_.Area:
+            lazy = _imports()
+            globals_ = lazy.globals_
+            area = globals_.Area
+            if not area:
+                return
+            
+            render_changed = _validate_render_cache()
+            generation = lazy.editGeneration()
+            engine = self.mouse_handler.engine
+            cached = self._db_cache
+            if (cached is not None and not render_changed and cached[0] is area and
+                    cached[1] == generation and cached[2] == engine.get_database_revision()):
                 return
+            _fit_object_tiles_cache(sum(map(len, area.layers)))
             
-            database = {}
+            # Tiles are accumulated as two parallel sequences (keys and object
+            # types) and turned into the database dict once at the end; later
+            # objects still win on overlap since dict() keeps the last value
+            tile_keys = []
+            tile_types = array('i')
             empty_slope_regions = set()  # Track empty tiles within slope bounds
             
-            # Scan all layers for existing objects
-            for layer_idx, layer in enumerate(globals_.Area.layers):
-                for obj in layer:
-                    # Use RenderObject to get the actual tile layout
-                    # This returns a 2D array where -1 = empty tile
-                    tile_array = RenderObject(obj.tileset, obj.type, obj.width, obj.height)
+            # Scan all layers for existing objects. Objects are visited in layer
+            # order on purpose: where objects overlap, the later (topmost) one
+            # must end up in the database, so they cannot be re-sorted (e.g.
+            # spatially) without changing which tile wins
+            for layer_idx, layer in enumerate(area.layers):
+                for object_signature in map(_OBJECT_SIGNATURE, layer):
+                    # Tile keys of an object only depend on its signature, so
+                    # objects that did not change since the last rebuild reuse
+                    # their cached keys
+                    keys, empty = _cached_object_tiles(*object_signature, layer_idx)
                     
                     # Add only non-empty tiles to the database
+                    tile_keys.extend(keys)
+                    tile_types.extend(itertools.repeat(object_signature[1], len(keys)))
+                    
                     # Track empty tiles within slope bounds separately
-                    for dy in range(obj.height):
-                        for dx in range(obj.width):
-                            tile_value = tile_array[dy][dx] if dy < len(tile_array) and dx < len(tile_array[dy]) else -1
-                            
-                            x = obj.objx + dx
-                            y = obj.objy + dy
-                            
-                            if tile_value != -1:
-                                # This is an actual tile, add to database
-                                database[(x, y, layer_idx)] = obj.type
-                            else:
-                                # This is an empty tile within slope bounds
-                                # QPT should NOT place tiles here
-                                empty_slope_regions.add((x, y, layer_idx))
+                    # QPT should NOT place tiles here
+                    if empty:
+                        empty_slope_regions.update(empty)
+            
+            database = dict(zip(tile_keys, tile_types))
             
-            # Update the engine's object database and empty slope regions
+            # Update the engine's object database and empty slope regions. No
+            # copy is kept here: the engine makes its own for the painting
+            # session, and any later edit to its database changes its revision
             self.mouse_handler.update_object_database(database, empty_slope_regions)
-            print(f"[QPT] Refreshed object database: {len(database)} tiles ({len(empty_slope_regions)} empty tiles in slopes skipped)")
+            self._db_cache = (area, generation, engine.get_database_revision())
+            if log_enabled():
+                log(f"Refreshed object database: {len(database)} tiles ({len(empty_slope_regions)} empty tiles in slopes skipped)")
         except Exception as e:
             print(f"[QPT] Error refreshing object database: {e}")
             import traceback
             traceback.print_exc()
     
+    def _queue_outline(self, positions: List = None):
+        """Store the latest outline and schedule a coalesced update"""
+        self._pending_outline = positions
+        if not self._outline_timer.isActive():
+            self._outline_timer.start()
+    
+    def _flush_outline(self):
+        """Apply the most recent queued outline update"""
+        positions = self._pending_outline
+        self._pending_outline = None
+        self.on_outline_updated(positions)
+    
     def on_outline_updated(self, positions: List = None):
         """
         Handle outline update - show preview of where tiles will be placed.
@@ -753,11 +1522,15 @@ class QuickPaintTab(QtWidgets.QWidget):
         Args:
             positions: List of (x, y) positions (optional, can be None)
         """
-        # Call the reggie_hook to update the visual outline
-        from reggie.core import globals_
-        qpt_funcs = getattr(globals_, 'qpt_functions', None)
-        if qpt_funcs and qpt_funcs.get('update_outline'):
-            qpt_funcs['update_outline']()
+        # Call the reggie_hook to update the visual outline (resolved once,
+        # the hook registers its functions at startup)
+        update_outline = self._update_outline_fn
+        if update_outline is None:
+            qpt_funcs = getattr(_imports().globals_, 'qpt_functions', None)
+            update_outline = self._update_outline_fn = qpt_funcs.get('update_outline') if qpt_funcs else None
+            if update_outline is None:
+                return
+        update_outline()
     
     def handle_mouse_event(self, event_type: str, pos: tuple, button: int = 2) -> bool:
         """
@@ -771,32 +1544,36 @@ class QuickPaintTab(QtWidgets.QWidget):
         Returns:
             True if event was handled, False otherwise
         """
-        current_mode = self.qpt_widget.get_current_mode()
+        widget = self._qpt_widget or self.qpt_widget
+        current_mode = widget.current_mode
         
         # Single Tile and Eraser modes don't require "Start Painting"
         # They are always active when their mode is selected
-        if current_mode in ("Single Tile", "Eraser"):
+        if current_mode in _SIMPLE_BRUSH_MODES:
             return self._handle_simple_brush_event(event_type, pos, button, current_mode)
         
         # SmartPaint mode requires explicit Start Painting
-        is_painting = self.qpt_widget.is_painting()
+        is_painting = widget.painting_active
         # Reduce log spam for move events
-        if event_type != "move":
-            print(f"[QPT] handle_mouse_event: type={event_type}, pos={pos}, button={button}, is_painting={is_painting}")
+        if event_type != "move" and log_enabled():
+            log(f"handle_mouse_event: type={event_type}, pos={pos}, button={button}, is_painting={is_painting}")
         
         if not is_painting:
             return False
         
-        if event_type == "press":
-            # Refresh object database before starting to paint
+        handler = self._smart_dispatch.get(event_type)
+        return handler(pos, button) if handler else False
+    
+    def _smart_press(self, pos: tuple, button: int) -> bool:
+        """SmartPaint press: refresh the object database if needed, then start the stroke"""
+        # Refresh object database before starting to paint
+        if self.mouse_handler.needs_terrain_db():
             self._refresh_object_database()
-            return self.mouse_handler.on_mouse_press(pos, button)
-        elif event_type == "move":
-            return self.mouse_handler.on_mouse_move(pos)
-        elif event_type == "release":
-            return self.mouse_handler.on_mouse_release(pos, button)
-        
-        return False
+        return self.mouse_handler.on_mouse_press(pos, button)
+    
+    def _smart_move(self, pos: tuple, button: int) -> bool:
+        """SmartPaint move (button is not used while dragging)"""
+        return self.mouse_handler.on_mouse_move(pos)
     
     def _handle_simple_brush_event(self, event_type: str, pos: tuple, button: int, mode: str) -> bool:
         """
@@ -812,73 +1589,86 @@ class QuickPaintTab(QtWidgets.QWidget):
         Returns:
             True if event was handled
         """
-        from reggie.core import globals_
+        globals_ = _imports().globals_
         
         if event_type == "press":
             # Only handle right-click for starting paint/erase
             if button != 2:
                 return False
-            # Start simple brush stroke
+            # Start simple brush stroke; objects are looked up through a
+            # spatial index for the duration of the stroke
+            self._spatial = {}
             self._simple_brush_active = True
             self._simple_brush_last_pos = pos
-            self._apply_simple_brush(pos, mode)
+            self._simple_brush_last_tile = (int(pos[0]), int(pos[1]))
+            with _deferred_scene_updates(globals_.mainWindow.scene):
+                changed = self._apply_simple_brush(pos, mode)
+            if changed:
+                _imports().SetDirty()
             return True
         elif event_type == "move":
             if getattr(self, '_simple_brush_active', False):
                 # Interpolate between last position and current position
                 last_pos = getattr(self, '_simple_brush_last_pos', pos)
                 positions = self._interpolate_positions(last_pos, pos)
-                for p in positions:
-                    self._apply_simple_brush(p, mode)
+                # The line starts on the tile the previous event ended on,
+                # which is already painted
+                last_tile = getattr(self, '_simple_brush_last_tile', None)
+                # One scene update (and selectionChanged, if a selected
+                # object was erased or painted over) for the whole segment,
+                # and one SetDirty if any tile in it was actually changed
+                changed = False
+                with _deferred_scene_updates(globals_.mainWindow.scene):
+                    for p in itertools.islice(positions, 1, None):
+                        if p == last_tile:
+                            continue
+                        # Interpolated positions are already ints
+                        if self._apply_simple_brush_int(p[0], p[1], mode):
+                            changed = True
+                        last_tile = p
+                self._simple_brush_last_tile = last_tile
+                if changed:
+                    _imports().SetDirty()
                 self._simple_brush_last_pos = pos
                 return True
         elif event_type == "release":
             self._simple_brush_active = False
             self._simple_brush_last_pos = None
+            self._simple_brush_last_tile = None
+            self._spatial = None
             return True
         
         return False
     
     def _interpolate_positions(self, start: tuple, end: tuple) -> list:
-        """Interpolate positions between start and end using Bresenham's algorithm"""
-        x0, y0 = int(start[0]), int(start[1])
-        x1, y1 = int(end[0]), int(end[1])
-        
-        positions = []
-        dx = abs(x1 - x0)
-        dy = abs(y1 - y0)
-        sx = 1 if x0 < x1 else -1
-        sy = 1 if y0 < y1 else -1
-        err = dx - dy
-        
-        while True:
-            positions.append((x0, y0))
-            if x0 == x1 and y0 == y1:
-                break
-            e2 = 2 * err
-            if e2 > -dy:
-                err -= dy
-                x0 += sx
-            if e2 < dx:
-                err += dx
-                y0 += sy
+        """
+        Interpolate positions between start and end using Bresenham's algorithm.
         
-        return positions
+        The returned list is the tab's reusable buffer; it is only valid
+        until the next call.
+        """
+        return _bresenham_line(int(start[0]), int(start[1]), int(end[0]), int(end[1]), self._interp_buf)
     
-    def _apply_simple_brush(self, pos: tuple, mode: str):
+    def _apply_simple_brush(self, pos: tuple, mode: str) -> bool:
         """Apply the simple brush (single tile or eraser) at the given position"""
-        from reggie.core import globals_
-        from reggie.core.levelitems import ObjectItem
-        from reggie.core.tiles import CreateTilesets
+        return self._apply_simple_brush_int(int(pos[0]), int(pos[1]), mode)
+    
+    def _apply_simple_brush_int(self, x: int, y: int, mode: str) -> bool:
+        """
+        Apply the simple brush at integer tile coordinates (no conversion).
+        
+        Returns:
+            True if an object was placed or removed
+        """
+        globals_ = _imports().globals_
         
-        x, y = int(pos[0]), int(pos[1])
         layer = self.qpt_widget.get_current_layer() if self.qpt_widget else globals_.CurrentLayer
         
         if mode == "Single Tile":
             # Get the selected tile from the tileset selector
             selected_obj_id = self.tileset_selector.selected_object_id
             if selected_obj_id is None:
-                return
+                return False
             
             # Get the tileset slot
             tileset_slot = self.tileset_selector.tileset_combo.currentIndex()
@@ -886,67 +1676,92 @@ class QuickPaintTab(QtWidgets.QWidget):
             # Check if there's already an object at this position
             existing = self._get_object_at(x, y, layer)
             if existing:
+                # Already the selected tile: nothing to repaint
+                if (existing.width == 1 and existing.height == 1 and
+                        existing.type == selected_obj_id and existing.tileset == tileset_slot):
+                    return False
                 # Remove existing object
-                self._remove_object(existing)
+                removed = self._remove_object(existing)
+            else:
+                removed = False
             
             # Create new object (1x1 size)
-            self._place_object(tileset_slot, selected_obj_id, x, y, 1, 1, layer)
+            placed = self._place_object(tileset_slot, selected_obj_id, x, y, 1, 1, layer)
+            return removed or placed
             
         elif mode == "Eraser":
             # Find and remove any object at this position
             existing = self._get_object_at(x, y, layer)
             if existing:
-                self._remove_object(existing)
+                return self._remove_object(existing)
+        
+        return False
     
     def _get_object_at(self, x: int, y: int, layer: int):
         """Get the object at the given tile position"""
-        from reggie.core import globals_
+        globals_ = _imports().globals_
         
         if not hasattr(globals_.Area, 'layers') or layer >= len(globals_.Area.layers):
             return None
         
-        for obj in globals_.Area.layers[layer]:
+        layer_obj = globals_.Area.layers[layer]
+        if self._spatial is not None:
+            buckets = self._spatial_layer(layer, layer_obj)
+            candidates = buckets.get((x >> _SPATIAL_BUCKET_SHIFT, y >> _SPATIAL_BUCKET_SHIFT), ())
+        else:
+            candidates = layer_obj
+        
+        for obj in candidates:
             if (obj.objx <= x < obj.objx + obj.width and
                 obj.objy <= y < obj.objy + obj.height):
                 return obj
         
         return None
     
-    def _remove_object(self, obj):
-        """Remove an object from the scene and layer (undo-aware)"""
-        from reggie.core.dirty import SetDirty
-        from reggie.core import undo as undo_module
-
+    def _remove_object(self, obj) -> bool:
+        """
+        Remove an object from the scene and layer (undo-aware; the caller marks the level dirty).
+        
+        Returns:
+            True if the object was removed
+        """
         try:
-            undo_module.bulk_remove_object(obj)
-            SetDirty()
+            _imports().undo_module.bulk_remove_object(obj)
+            self._spatial_discard(obj.layer, obj)
+            return True
         except Exception as e:
             print(f"[QPT] Error removing object: {e}")
+            return False
     
-    def _place_object(self, tileset: int, obj_type: int, x: int, y: int, width: int, height: int, layer: int):
-        """Place a new object at the given position"""
-        from reggie.core import globals_
-        from reggie.core.levelitems import ObjectItem
-        from reggie.core.dirty import SetDirty
+    def _place_object(self, tileset: int, obj_type: int, x: int, y: int, width: int, height: int,
+                      layer: int) -> bool:
+        """
+        Place a new object at the given position (the caller marks the level dirty).
+        
+        Returns:
+            True if the object was placed
+        """
+        lazy = _imports()
+        globals_ = lazy.globals_
         
         try:
             # Create the object
-            obj = ObjectItem(tileset, obj_type, layer, x, y, width, height, 1)
+            obj = lazy.ObjectItem(tileset, obj_type, layer, x, y, width, height, 1)
 
             # Add to layer
             if layer < len(globals_.Area.layers):
                 globals_.Area.layers[layer].append(obj)
+                self._spatial_add(layer, obj)
 
             # Add to scene
             globals_.mainWindow.scene.addItem(obj)
 
             # Recorded only while a bulk edit session is open
-            from reggie.core import undo as undo_module
-            undo_module.notify_item_created(obj)
-
-            SetDirty()
+            lazy.undo_module.notify_item_created(obj)
+            return True
         except Exception as e:
             print(f"[QPT] Error placing object: {e}")
+            return False
     
     def get_outline(self) -> List[tuple]:
         """Get the current painting outline"""
@@ -1183,7 +1998,7 @@ class FillPaintTab(QtWidgets.QWidget):
         super().__init__(parent)
         
         from reggie.plugins.quickpaint.core.fill_engine import get_fill_engine, FillState
-        from reggie.plugins.quickpaint.core.tool_manager import get_tool_manager, ToolType
+        from reggie.plugins.quickpaint.core.tool_manager import get_tool_manager
         
         self.fill_engine = get_fill_engine()
         self.tool_manager = get_tool_manager()
@@ -1202,11 +2017,22 @@ class FillPaintTab(QtWidgets.QWidget):
         self._deco_containers: List[DecoContainer] = []
         self._active_deco_container: Optional[DecoContainer] = None
         
+        # Text last put on the status label; setting the same text again is a no-op
+        self._status_text: Optional[str] = None
+        
+        # Fill previews arrive at flood-fill/mouse rate; coalesce their status
+        # text so the label changes at most once per frame (~60 Hz)
+        self._pending_preview_count: Optional[int] = None
+        self._preview_status_timer = QtCore.QTimer(self)
+        self._preview_status_timer.setSingleShot(True)
+        self._preview_status_timer.setInterval(16)
+        self._preview_status_timer.timeout.connect(self._flush_preview_status)
+        
         self.init_ui()
     
     def init_ui(self):
         """Initialize the UI"""
-        from reggie.plugins.quickpaint.ui.tileset_selector import TilesetSelector
+        TilesetSelector = _widgets().TilesetSelector
         
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -1377,7 +2203,6 @@ class FillPaintTab(QtWidgets.QWidget):
     
     def _on_fill_radio_toggled(self, checked: bool):
         """Handle fill radio button toggle"""
-        from reggie.plugins.quickpaint.core.tool_manager import ToolType
         from reggie.core import globals_
         
         if checked:
@@ -1389,37 +2214,67 @@ class FillPaintTab(QtWidgets.QWidget):
             from reggie.plugins.quickpaint.core.fill_engine import FillState
             if self.fill_engine.state == FillState.PREVIEW:
                 count = len(self.fill_engine.fill_positions)
-                self.status_label.setText(f"Fill: Preview - {count} tiles (right-click to confirm)")
+                self.set_status(f"Fill: Preview - {count} tiles (right-click to confirm)")
             else:
-                self.status_label.setText("Fill: Ready - Right-click to create fill area")
+                self.set_status("Fill: Ready - Right-click to create fill area")
             # Set cursor based on whether fill object is selected
             self._update_fill_cursor()
         else:
-            self.status_label.setText("Idle")
+            self.set_status("Idle")
     
     def _deselect_all_deco_containers(self):
-        """Deselect all deco container radio buttons"""
-        for container in self._deco_containers:
-            if container.is_selected():
-                container.radio.blockSignals(True)
-                container.deselect()
-                container.radio.blockSignals(False)
+        """
+        Deselect all deco container radio buttons.
+        
+        Only one container can be selected at a time and every selection
+        goes through _on_deco_container_selected, so only the active one
+        needs to be deselected.
+        """
+        container = self._active_deco_container
+        if container is not None and container.is_selected():
+            container.radio.blockSignals(True)
+            container.deselect()
+            container.radio.blockSignals(False)
         self._active_deco_container = None
     
+    def set_status(self, text: str):
+        """
+        Set the status label text.
+        
+        Drops any queued preview status, and skips the label update when the
+        text did not change.
+        
+        Args:
+            text: Status text
+        """
+        self._pending_preview_count = None
+        self._preview_status_timer.stop()
+        if text != self._status_text:
+            self._status_text = text
+            self.status_label.setText(text)
+    
     def _on_fill_preview(self, positions: list):
-        """Handle fill preview update"""
+        """Handle fill preview update (status text is applied by _flush_preview_status)"""
         count = len(positions)
+        self.clear_area_btn.setEnabled(count > 0)
+        self._pending_preview_count = count
+        if not self._preview_status_timer.isActive():
+            self._preview_status_timer.start()
+    
+    def _flush_preview_status(self):
+        """Show the status text of the most recent fill preview"""
+        count = self._pending_preview_count
+        if count is None:
+            return
         if count > 0:
-            self.status_label.setText(f"Fill: Preview - {count} tiles (right-click to confirm)")
-            self.clear_area_btn.setEnabled(True)
+            self.set_status(f"Fill: Preview - {count} tiles (right-click to confirm)")
         else:
-            self.status_label.setText("Fill: Ready - Right-click to create fill area")
-            self.clear_area_btn.setEnabled(False)
+            self.set_status("Fill: Ready - Right-click to create fill area")
     
     def _on_fill_confirmed(self, positions: list):
         """Handle fill confirmation"""
         count = len(positions)
-        self.status_label.setText(f"Fill: Placed {count} tiles")
+        self.set_status(f"Fill: Placed {count} tiles")
         self.clear_area_btn.setEnabled(False)
         self.fill_confirmed.emit(positions)
         
@@ -1441,39 +2296,47 @@ class FillPaintTab(QtWidgets.QWidget):
         if not positions:
             return
         
+        # Containers that will actually place something: a deco object is
+        # assigned and the probability slider is above zero
+        active = []
+        for container in self._deco_containers:
+            if container.get_object_info()[1] is None:
+                continue  # Skip containers without objects
+            probability = container.prob_slider.value() / 100.0
+            if probability > 0:
+                active.append((container, probability))
+        if not active:
+            return
+        
         # Convert to set for efficient lookup
         fill_positions_set = set(positions) if isinstance(positions[0], tuple) else set((p[0], p[1]) for p in positions)
 
         # Shared set to track all occupied positions across all deco fill operations
+        # (packed like pack_tile_key with layer 0)
         # This ensures consecutive deco fills don't overlap with each other
         shared_occupied = set()
 
+        # Deco and foreign tiles of the fill area, looked up once for all
+        # containers (tiles placed by earlier containers are in shared_occupied)
+        blocked_positions = self._blocked_fill_positions(fill_positions_set, self._current_layer)
+
         from reggie.core import undo as undo_module
 
         applied_count = 0
         with undo_module.bulk_edit_session('Quick Paint deco fill'):
-            for container in self._deco_containers:
-                # Check if container has a deco object set
-                tileset, object_id, obj_width, obj_height = container.get_object_info()
-                if object_id is None:
-                    continue  # Skip containers without objects
-
-                # Get probability from the container's slider
-                probability = container.prob_slider.value() / 100.0
-                if probability <= 0:
-                    continue  # Skip if probability is 0
-
+            for container, probability in active:
                 # Apply deco fill for this container, passing fill positions and shared occupied
                 print(f"[FillPaintTab] Auto-applying deco: container #{container.container_id}, prob={probability:.0%}")
-                self._apply_deco_fill(container, probability, shared_occupied, fill_positions_set)
+                self._apply_deco_fill(container, probability, shared_occupied, fill_positions_set,
+                                      blocked_positions)
                 applied_count += 1
 
         if applied_count > 0:
-            self.status_label.setText(f"Fill: Placed tiles + {applied_count} deco layer(s)")
+            self.set_status(f"Fill: Placed tiles + {applied_count} deco layer(s)")
     
     def _on_fill_cancelled(self):
         """Handle fill cancellation"""
-        self.status_label.setText("Cancelled")
+        self.set_status("Cancelled")
         self.clear_area_btn.setEnabled(False)
         self.fill_cancelled.emit()
     
@@ -1481,7 +2344,7 @@ class FillPaintTab(QtWidgets.QWidget):
         """Handle fill area warning - ask user if they want to continue"""
         from reggie.plugins.quickpaint.core.fill_engine import MAX_FILL_AREA
         
-        self.status_label.setText(f"Fill: Large area ({count}+ tiles) - confirm to continue")
+        self.set_status(f"Fill: Large area ({count}+ tiles) - confirm to continue")
         
         reply = QtWidgets.QMessageBox.question(
             self,
@@ -1496,11 +2359,11 @@ class FillPaintTab(QtWidgets.QWidget):
         if reply == QtWidgets.QMessageBox.StandardButton.Yes:
             # User wants to continue - calculate full fill area
             result = self.fill_engine.continue_fill()
-            self.status_label.setText(f"Fill: Preview - {result.count} tiles (right-click to confirm)")
+            self.set_status(f"Fill: Preview - {result.count} tiles (right-click to confirm)")
         else:
             # User cancelled - reset to idle
             self.fill_engine.cancel_fill()
-            self.status_label.setText("Cancelled - area too large")
+            self.set_status("Cancelled - area too large")
     
     def _on_fill_object_selected(self, tileset: int, obj_type: int, obj_id: int):
         """Handle fill object selection from tileset selector"""
@@ -1547,17 +2410,16 @@ class FillPaintTab(QtWidgets.QWidget):
     
     def _on_deco_container_selected(self, container: DecoContainer):
         """Handle deco container selection"""
-        from reggie.plugins.quickpaint.core.tool_manager import ToolType
         from reggie.core import globals_
         
-        self._active_deco_container = container
+        # Deselect the previously active container
+        previous = self._active_deco_container
+        if previous is not None and previous is not container and previous.is_selected():
+            previous.radio.blockSignals(True)
+            previous.deselect()
+            previous.radio.blockSignals(False)
         
-        # Deselect other containers
-        for c in self._deco_containers:
-            if c != container and c.is_selected():
-                c.radio.blockSignals(True)
-                c.deselect()
-                c.radio.blockSignals(False)
+        self._active_deco_container = container
         
         # Deselect fill radio
         self.fill_radio.blockSignals(True)
@@ -1570,9 +2432,9 @@ class FillPaintTab(QtWidgets.QWidget):
         from reggie.plugins.quickpaint.core.fill_engine import FillState
         if self.fill_engine.state == FillState.PREVIEW:
             count = len(self.fill_engine.fill_positions)
-            self.status_label.setText(f"Deco: Preview - {count} tiles (right-click to confirm)")
+            self.set_status(f"Deco: Preview - {count} tiles (right-click to confirm)")
         else:
-            self.status_label.setText("Deco: Ready - Right-click to create fill area")
+            self.set_status("Deco: Ready - Right-click to create fill area")
         
         # Set crosshair cursor
         if hasattr(globals_, 'mainWindow') and globals_.mainWindow and globals_.mainWindow.view:
@@ -1593,7 +2455,66 @@ class FillPaintTab(QtWidgets.QWidget):
         print(f"[FillPaintTab] Deco fill requested: container #{container.container_id}, probability={probability}")
         self._apply_deco_fill(container, probability)
     
-    def _apply_deco_fill(self, container: DecoContainer, probability: float, shared_occupied: set = None, fill_positions: set = None):
+    def _blocked_fill_positions(self, fill_positions, layer: int) -> set:
+        """
+        Fill positions that already hold a deco or foreign tile.
+        
+        Classifies tiles the way reggie_hook's get_tile_type does (the first
+        object in the layer with a filled tile at a position decides, and
+        anything but the fill object blocks), but in a single pass over the
+        layer instead of one full layer scan per position.
+        
+        Args:
+            fill_positions: Iterable of (x, y) fill positions
+            layer: Layer to check
+        
+        Returns:
+            Set of positions no deco object may cover, packed like
+            pack_tile_key with layer 0
+        """
+        from reggie.core import globals_
+        
+        blocked = set()
+        area = globals_.Area
+        layers = getattr(area, 'layers', None) if area is not None else None
+        if not fill_positions or not layers or layer >= len(layers):
+            return blocked
+        
+        # Positions not classified yet (packed)
+        remaining = {pack_tile_key(x, y, 0) for x, y in fill_positions}
+        fill_x0 = min(x for x, _ in fill_positions)
+        fill_y0 = min(y for _, y in fill_positions)
+        fill_x1 = max(x for x, _ in fill_positions) + 1
+        fill_y1 = max(y for _, y in fill_positions) + 1
+        
+        fill_kind = (self._tileset_idx, self._fill_object_id) if self._fill_object_id is not None else None
+        
+        _validate_render_cache()
+        for obj in layers[layer]:
+            obj_x = obj.objx
+            obj_y = obj.objy
+            if (obj_x >= fill_x1 or obj_y >= fill_y1 or
+                    obj_x + obj.width <= fill_x0 or obj_y + obj.height <= fill_y0):
+                continue
+            
+            # Empty slope tiles are not in the offsets, so later objects
+            # still get to classify those positions
+            blocks = (obj.tileset, obj.type) != fill_kind
+            base = (obj_y << 24) + obj_x
+            for offset in _cached_packed_offsets(obj.tileset, obj.type, obj.width, obj.height):
+                key = base + offset
+                if key in remaining:
+                    remaining.discard(key)
+                    if blocks:
+                        blocked.add(key)
+            
+            if not remaining:
+                break
+        
+        return blocked
+    
+    def _apply_deco_fill(self, container: DecoContainer, probability: float, shared_occupied: set = None,
+                         fill_positions: set = None, blocked_positions: set = None):
         """
         Apply deco fill to the current fill area.
         
@@ -1601,11 +2522,13 @@ class FillPaintTab(QtWidgets.QWidget):
             container: The deco container with object info
             probability: Fill probability (0.0 to 1.0)
             shared_occupied: Optional set of already occupied positions from previous
-                           deco fill operations (used by auto-apply)
+                           deco fill operations (used by auto-apply), packed like
+                           pack_tile_key with layer 0
             fill_positions: Optional set of fill positions to use (for auto-fill).
                           If None, uses fill_engine.fill_positions.
+            blocked_positions: Optional result of _blocked_fill_positions for
+                             fill_positions, shared by auto-apply across containers
         """
-        import random
         from reggie.core import globals_
         from reggie.core.dirty import SetDirty
         
@@ -1630,50 +2553,29 @@ class FillPaintTab(QtWidgets.QWidget):
         # Get current layer from Fill Paint tab's layer selector
         current_layer = self._current_layer
         
-        # Get tile type checker from reggie_hook
-        get_tile_type = None
-        if hasattr(globals_, 'qpt_functions') and 'get_tile_type' in globals_.qpt_functions:
-            get_tile_type = globals_.qpt_functions['get_tile_type']
+        # Tile types are looked up once per fill position (auto-apply passes
+        # the lookup in, so it is shared by all containers)
+        if blocked_positions is None:
+            blocked_positions = self._blocked_fill_positions(fill_positions, current_layer)
         
         # Use shared occupied set if provided (for auto-apply), otherwise create new
         if shared_occupied is None:
             shared_occupied = set()
         
         # Filter positions: only allow empty or fill tiles (not deco or foreign)
-        # Also check if multi-tile object fits within the fill area
-        # And check against shared_occupied for positions from previous deco fills
-        valid_positions = []
-        for x, y in fill_positions:
-            # Check if object fits at this position (all tiles in fill area)
-            fits = True
-            can_place = True
-            
-            for dx in range(obj_width):
-                for dy in range(obj_height):
-                    check_x, check_y = x + dx, y + dy
-                    
-                    # Must be within fill area
-                    if (check_x, check_y) not in fill_positions:
-                        fits = False
-                        break
-                    
-                    # Check against shared occupied positions (from previous deco fills)
-                    if (check_x, check_y) in shared_occupied:
-                        can_place = False
-                        break
-                    
-                    # Check tile type - only allow empty or fill tiles
-                    if get_tile_type:
-                        tile_type = get_tile_type(check_x, check_y, current_layer)
-                        if tile_type in ('deco', 'foreign'):
-                            can_place = False
-                            break
-                
-                if not fits or not can_place:
-                    break
+        # that are not taken by previous deco fills (shared_occupied), and keep
+        # the anchors where the whole multi-tile object fits on such tiles
+        single_tile = obj_width == 1 and obj_height == 1
+        if single_tile:
+            # 1x1 objects (most deco): every free fill position fits
+            excluded = shared_occupied | blocked_positions if blocked_positions else shared_occupied
+            valid_positions = [(x, y) for x, y in fill_positions if (y << 24) + x not in excluded]
+        else:
+            def usable(x, y):
+                key = (y << 24) + x
+                return key not in shared_occupied and key not in blocked_positions
             
-            if fits and can_place:
-                valid_positions.append((x, y))
+            valid_positions = _deco_fit_positions(fill_positions, obj_width, obj_height, usable)
         
         if not valid_positions:
             QtWidgets.QMessageBox.information(
@@ -1692,32 +2594,50 @@ class FillPaintTab(QtWidgets.QWidget):
         if num_to_place == 0 and probability > 0:
             num_to_place = 1  # At least try to place one
         
-        # Randomly shuffle positions
-        random.shuffle(valid_positions)
-        
-        # Place deco objects, tracking occupied positions to prevent overlap
+        # Multi-tile objects at low density are drawn from a lattice with the
+        # object's size as stride (at a random phase): lattice anchors never
+        # overlap each other, so every draw is placed. Dense fills keep the
+        # full candidate list and rely on the overlap check below.
+        candidates = valid_positions
+        if object_area > 1:
+            phase_x = random.randrange(obj_width)
+            phase_y = random.randrange(obj_height)
+            lattice = [(x, y) for x, y in valid_positions
+                       if (x - phase_x) % obj_width == 0 and (y - phase_y) % obj_height == 0]
+            if num_to_place * 2 <= len(lattice):
+                candidates = lattice
+        
+        # Place deco objects at randomly drawn positions, tracking occupied
+        # positions to prevent overlap. Positions are drawn lazily, so only as
+        # many are shuffled as it takes to place num_to_place objects.
         # Use shared_occupied to track positions across multiple deco fill operations
         placed_count = 0
         
-        for x, y in valid_positions:
+        if single_tile:
+            # No draw can be rejected, so exactly num_to_place are sampled
+            draws = random.sample(candidates, min(num_to_place, len(candidates)))
+        else:
+            draws = _random_order(candidates)
+        
+        # Loop invariants bound once; the object footprint is kept as packed
+        # (dy << 24) + dx offsets from its anchor
+        create_object = globals_.mainWindow.CreateObject
+        mark_occupied = shared_occupied.update
+        footprint = tuple([(dy << 24) + dx for dx in range(obj_width) for dy in range(obj_height)])
+        
+        for x, y in draws:
             if placed_count >= num_to_place:
                 break
             
             # Check if this position overlaps with already placed deco objects (within this operation)
-            overlaps = False
-            for dx in range(obj_width):
-                for dy in range(obj_height):
-                    if (x + dx, y + dy) in shared_occupied:
-                        overlaps = True
-                        break
-                if overlaps:
-                    break
-            
-            if overlaps:
+            # Occupied positions are packed as (y << 24) + x. Distinct free
+            # 1x1 positions can never overlap, so they skip the check.
+            base = (y << 24) + x
+            if not single_tile and any(base + offset in shared_occupied for offset in footprint):
                 continue
             
             try:
-                obj = globals_.mainWindow.CreateObject(
+                obj = create_object(
                     tileset,
                     object_id,
                     current_layer,
@@ -1727,9 +2647,7 @@ class FillPaintTab(QtWidgets.QWidget):
                 if obj:
                     placed_count += 1
                     # Mark all positions covered by this object as occupied
-                    for dx in range(obj_width):
-                        for dy in range(obj_height):
-                            shared_occupied.add((x + dx, y + dy))
+                    mark_occupied([base + offset for offset in footprint])
             except Exception as e:
                 print(f"Error placing deco at ({x}, {y}): {e}")
         
@@ -1738,7 +2656,7 @@ class FillPaintTab(QtWidgets.QWidget):
             globals_.mainWindow.scene.update()
         
         print(f"[FillPaintTab] Placed {placed_count} deco objects")
-        self.status_label.setText(f"Deco: Placed {placed_count} objects")
+        self.set_status(f"Deco: Placed {placed_count} objects")
     
     def set_fill_object(self, tileset: int, object_id: int):
         """Set the fill object"""
@@ -1752,7 +2670,6 @@ class FillPaintTab(QtWidgets.QWidget):
     def _update_fill_cursor(self):
         """Update cursor based on fill tool state"""
         from reggie.core import globals_
-        from reggie.plugins.quickpaint.core.tool_manager import ToolType
         
         if not hasattr(globals_, 'mainWindow') or not globals_.mainWindow or not globals_.mainWindow.view:
             return
@@ -1769,7 +2686,6 @@ class FillPaintTab(QtWidgets.QWidget):
     
     def activate(self):
         """Activate the fill tool"""
-        from reggie.plugins.quickpaint.core.tool_manager import ToolType
         from reggie.plugins.quickpaint.core.fill_engine import FillState
         self.fill_radio.setChecked(True)
         # Ensure tool manager is activated even if radio was already checked
@@ -1777,9 +2693,9 @@ class FillPaintTab(QtWidgets.QWidget):
         # Show preview count if fill area already exists
         if self.fill_engine.state == FillState.PREVIEW:
             count = len(self.fill_engine.fill_positions)
-            self.status_label.setText(f"Fill: Preview - {count} tiles (right-click to confirm)")
+            self.set_status(f"Fill: Preview - {count} tiles (right-click to confirm)")
         else:
-            self.status_label.setText("Fill: Ready - Right-click to create fill area")
+            self.set_status("Fill: Ready - Right-click to create fill area")
         self._update_fill_cursor()
     
     def deactivate(self):
@@ -1825,7 +2741,7 @@ class FillPaintTab(QtWidgets.QWidget):
         self.fill_engine.cancel_fill()
         
         # Reset status
-        self.status_label.setText("Idle")
+        self.set_status("Idle")
         
         print("[FillPaintTab] Reset complete")
     
@@ -1841,7 +2757,6 @@ class FillPaintTab(QtWidgets.QWidget):
         Returns:
             True if event was handled
         """
-        from reggie.plugins.quickpaint.core.tool_manager import ToolType
         from reggie.plugins.quickpaint.core.fill_engine import FillState
         
         print(f"[FillPaintTab] handle_mouse_event: type={event_type}, pos={pos}, button={button}")
@@ -1862,7 +2777,7 @@ class FillPaintTab(QtWidgets.QWidget):
             # For Fill tool, require fill object to be selected
             # For Deco tool, we can create fill area without fill object
             if is_fill_active and self._fill_object_id is None:
-                self.status_label.setText("Fill: Select a fill object first")
+                self.set_status("Fill: Select a fill object first")
                 print("[FillPaintTab] No fill object selected")
                 return True
             
@@ -1878,15 +2793,15 @@ class FillPaintTab(QtWidgets.QWidget):
                 
                 if result.interrupted and result.exceeded_limit:
                     # Outside zone fill was auto-cancelled at threshold
-                    self.status_label.setText("Cancelled - area too large (outside zone)")
+                    self.set_status("Cancelled - area too large (outside zone)")
                 elif result.outside_zone:
-                    self.status_label.setText("Click inside a zone (or hold Shift)")
+                    self.set_status("Click inside a zone (or hold Shift)")
                 elif len(result.positions) == 0:
-                    self.status_label.setText("Cannot fill here (occupied or invalid)")
+                    self.set_status("Cannot fill here (occupied or invalid)")
                 else:
                     # Update status for deco tool
                     if is_deco_active:
-                        self.status_label.setText(f"Deco: Preview - {len(result.positions)} tiles (right-click to confirm)")
+                        self.set_status(f"Deco: Preview - {len(result.positions)} tiles (right-click to confirm)")
                 return True
                 
             elif self.fill_engine.state == FillState.PREVIEW:
@@ -1903,7 +2818,7 @@ class FillPaintTab(QtWidgets.QWidget):
                         probability = self._active_deco_container.prob_slider.value() / 100.0
                         self._apply_deco_fill(self._active_deco_container, probability)
                     else:
-                        self.status_label.setText("Deco: No container selected")
+                        self.set_status("Deco: No container selected")
                 return True
         
         return False
@@ -1918,16 +2833,15 @@ class FillPaintTab(QtWidgets.QWidget):
         Returns:
             True if event was handled
         """
-        from reggie.plugins.quickpaint.core.tool_manager import ToolType
         from reggie.plugins.quickpaint.core.fill_engine import FillState
         
         if key == QtCore.Qt.Key.Key_Escape.value:
             if self.fill_engine.state == FillState.PREVIEW:
                 self.fill_engine.cancel_fill()
                 if self.tool_manager.is_active(ToolType.DECO_FILL):
-                    self.status_label.setText("Deco: Ready - Right-click to create fill area")
+                    self.set_status("Deco: Ready - Right-click to create fill area")
                 else:
-                    self.status_label.setText("Fill: Ready - Right-click to create fill area")
+                    self.set_status("Fill: Ready - Right-click to create fill area")
                 return True
         
         if key == QtCore.Qt.Key.Key_F2.value:
@@ -1951,8 +2865,9 @@ class FillPaintTab(QtWidgets.QWidget):
         if self.fill_engine.state != FillState.PREVIEW:
             return
         
-        positions = list(self.fill_engine.fill_positions)
-        if not positions:
+        # fill_positions hands out a fresh set, used as is below
+        positions_set = self.fill_engine.fill_positions
+        if not positions_set:
             return
         
         from reggie.core import globals_
@@ -1968,11 +2883,10 @@ class FillPaintTab(QtWidgets.QWidget):
         layer = globals_.Area.layers[current_layer]
         
         # Find and delete objects that overlap with fill positions
-        positions_set = set(positions)
         objects_to_delete = []
         
         # Debug: show sample positions and objects
-        sample_pos = list(positions_set)[:3]
+        sample_pos = list(itertools.islice(positions_set, 3))
         print(f"[FillPaintTab] Clear area: layer={current_layer}, {len(layer)} objects, {len(positions_set)} positions")
         print(f"[FillPaintTab] Sample fill positions (tiles): {sample_pos}")
         
@@ -1981,42 +2895,61 @@ class FillPaintTab(QtWidgets.QWidget):
         for i, obj in enumerate(layer[:3]):
             print(f"[FillPaintTab] Object {i}: pos=({obj.objx},{obj.objy}), size={obj.width}x{obj.height}")
         
-        # Import RenderObject to check for empty tiles in slope objects
-        from reggie.core.tiles import RenderObject
-        
+        # Filled tile offsets come from the shared RenderObject cache, so each
+        # distinct (tileset, type, size) is rendered once, not once per object
+        _validate_render_cache()
+        packed_positions = {pack_tile_key(x, y, 0) for x, y in positions_set}
+        
+        # Coarse grid of the fill area: an object whose bounds share no grid
+        # cell with the fill cannot overlap it, so its tiles are never checked
+        shift = _SPATIAL_BUCKET_SHIFT
+        fill_buckets = {(x >> shift, y >> shift) for x, y in positions_set}
+        
+        # Bounding box of the fill area (exclusive right/bottom edges)
+        fill_x0 = min(x for x, _ in positions_set)
+        fill_y0 = min(y for _, y in positions_set)
+        fill_x1 = max(x for x, _ in positions_set) + 1
+        fill_y1 = max(y for _, y in positions_set) + 1
+        
+        # The layer is scanned rather than looked up through a persistent
+        # position -> object index: objects are added and removed by many
+        # editor paths (undo, paste, dialogs) that would all have to keep
+        # such an index current, and with the bounding-box rejection above
+        # an object outside the fill costs only four comparisons
         for obj in layer:
             # obj.objx/objy are already in tile coordinates
             obj_x = obj.objx
             obj_y = obj.objy
-            obj_w = obj.width
-            obj_h = obj.height
             
-            # Get tile array for this object to check for empty tiles (-1)
-            tile_array = RenderObject(obj.tileset, obj.type, obj_w, obj_h)
+            # Cheapest rejection first: bounds entirely outside the fill box
+            if (obj_x >= fill_x1 or obj_y >= fill_y1 or
+                    obj_x + obj.width <= fill_x0 or obj_y + obj.height <= fill_y0):
+                continue
+            
+            bucket_xs = range(obj_x >> shift, ((obj_x + obj.width - 1) >> shift) + 1)
+            bucket_ys = range(obj_y >> shift, ((obj_y + obj.height - 1) >> shift) + 1)
+            if fill_buckets.isdisjoint(itertools.product(bucket_xs, bucket_ys)):
+                continue
             
             # Check if any FILLED tile of this object is in the fill area
             # Skip empty tiles (-1) which are part of slope objects
-            found = False
-            for dx in range(obj_w):
-                for dy in range(obj_h):
-                    if (obj_x + dx, obj_y + dy) in positions_set:
-                        # Check if this tile is actually filled (not -1)
-                        tile_value = tile_array[dy][dx] if dy < len(tile_array) and dx < len(tile_array[dy]) else -1
-                        if tile_value != -1:
-                            objects_to_delete.append(obj)
-                            found = True
-                            break
-                if found:
+            base = (obj_y << 24) + obj_x
+            for offset in _cached_packed_offsets(obj.tileset, obj.type, obj.width, obj.height):
+                if base + offset in packed_positions:
+                    objects_to_delete.append(obj)
                     break
         
         print(f"[FillPaintTab] Found {len(objects_to_delete)} objects to delete")
         
-        # Delete the objects as one undo step
+        # Delete the objects as one undo step, with one scene update for the
+        # batch (and one selectionChanged if a selected object was deleted)
         from reggie.core import undo as undo_module
-        with undo_module.bulk_edit_session('Quick Paint clear fill'):
-            for obj in objects_to_delete:
-                undo_module.bulk_remove_object(obj)
-                deleted_count += 1
+        if objects_to_delete:
+            with undo_module.bulk_edit_session('Quick Paint clear fill'), \
+                    _deferred_scene_updates(globals_.mainWindow.scene):
+                for obj in objects_to_delete:
+                    undo_module.bulk_remove_object(obj)
+                    deleted_count += 1
         
         # Cancel the fill preview
         self.fill_engine.cancel_fill()
@@ -2024,10 +2957,9 @@ class FillPaintTab(QtWidgets.QWidget):
         # Mark level as dirty
         if deleted_count > 0:
             SetDirty()
-            globals_.mainWindow.scene.update()
         
-        self.status_label.setText(f"Cleared: {deleted_count} objects deleted")
-        print(f"[FillPaintTab] Cleared fill area: {deleted_count} objects deleted from {len(positions)} tile positions")
+        self.set_status(f"Cleared: {deleted_count} objects deleted")
+        print(f"[FillPaintTab] Cleared fill area: {deleted_count} objects deleted from {len(positions_set)} tile positions")
     
     def get_fill_preview(self) -> List[tuple]:
         """Get current fill preview positions"""
@@ -2104,10 +3036,25 @@ class QuickPaintPalette(QtWidgets.QWidget):
         print("[QPT] OK: QWidget parent initialized")
         
         # Import tool manager
-        from reggie.plugins.quickpaint.core.tool_manager import get_tool_manager, ToolType
+        from reggie.plugins.quickpaint.core.tool_manager import get_tool_manager
         self.tool_manager = get_tool_manager()
         self.tool_manager.tool_changed.connect(self._on_tool_changed)
         
+        # Hotkey dispatch table (key code -> handler returning True if handled)
+        Key = QtCore.Qt.Key
+        self._hotkey_handlers = {
+            Key.Key_Q.value: self._hotkey_toggle_smart_paint,
+            Key.Key_S.value: functools.partial(self._hotkey_qpt_mode, "S", "Single Tile",
+                                               ToolType.QPT_SINGLE_TILE),
+            Key.Key_C.value: functools.partial(self._hotkey_qpt_mode, "C", "Shape Creator",
+                                               ToolType.QPT_SHAPE_CREATOR),
+            Key.Key_E.value: functools.partial(self._hotkey_qpt_mode, "E", "Eraser",
+                                               ToolType.QPT_ERASER),
+            Key.Key_F.value: self._hotkey_fill,
+            Key.Key_D.value: self._hotkey_deco,
+            Key.Key_Escape.value: self._hotkey_escape,
+        }
+        
         # Create button group for radio buttons across tabs
         self.tool_button_group = QtWidgets.QButtonGroup(self)
         self.tool_button_group.setExclusive(True)
@@ -2141,6 +3088,7 @@ class QuickPaintPalette(QtWidgets.QWidget):
         self.fill_paint_tab = FillPaintTab(button_group=self.tool_button_group)
         print("[QPT] OK: FillPaintTab created")
         self.tabs.addTab(self.fill_paint_tab, "Fill Paint")
+        self.quick_paint_tab.set_fill_tab(self.fill_paint_tab)
         
         # Outline Overlay tab (stub)
         print("[QPT] Creating OutlineOverlayTab...")
@@ -2156,14 +3104,16 @@ class QuickPaintPalette(QtWidgets.QWidget):
         print("[QPT] OK: Radio buttons added to button group")
         
         # Connect QPT mode combobox changes to deselect Fill/Deco radio buttons
-        self.quick_paint_tab.qpt_widget.mode_changed.connect(self._on_qpt_mode_selected)
+        # (once the tab has mounted its widgets)
+        self.quick_paint_tab.when_ui_ready(
+            lambda tab: tab.qpt_widget.mode_changed.connect(self._on_qpt_mode_selected)
+        )
         
         # Active tool display label (compact, below tabs)
         self.active_tool_label = QtWidgets.QLabel("Active: Quick Paint")
-        self.active_tool_label.setStyleSheet(
-            "background-color: #2d5a2d; color: white; padding: 2px 6px; "
-            "font-weight: bold; font-size: 9pt;"
-        )
+        self.active_tool_label.setStyleSheet(_TOOL_LABEL_STYLESHEETS["#2d5a2d"])
+        # Background color the label's stylesheet was last set for
+        self._tool_label_color = "#2d5a2d"
         self.active_tool_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self.active_tool_label.setFixedHeight(18)
         
@@ -2177,84 +3127,71 @@ class QuickPaintPalette(QtWidgets.QWidget):
         # Connect tab change signal AFTER all UI is created
         self.tabs.currentChanged.connect(self._on_tab_changed)
         
-        # Initialize with QPT active on first tab (use timer to ensure Reggie is ready)
-        QtCore.QTimer.singleShot(50, self._initialize_default_tool)
-        
-        # Install event filter on all child widgets to forward QPT hotkeys
-        self._install_event_filter_recursive(self)
+        # Initialize with QPT active on first tab once control returns to the
+        # event loop (after Reggie has finished building the palette)
+        QtCore.QMetaObject.invokeMethod(self, "_initialize_default_tool",
+                                        QtCore.Qt.ConnectionType.QueuedConnection)
+        
+        # QPT hotkeys while focus is anywhere inside the palette (including
+        # widgets added later); Qt's shortcut map dispatches them, so no event
+        # filter has to see the palette's events. Only the bare keys are
+        # registered: they are the ones kept out of user keybinds
+        # (QPT_RESERVED_KEYBINDS), while Shift/Ctrl/Alt variants may belong to
+        # menu shortcuts, mnemonics or user keybinds and would become ambiguous
+        for key in _QPT_HOTKEYS:
+            action = QtGui.QAction(self)
+            action.setShortcut(QtGui.QKeySequence(key))
+            action.setShortcutContext(QtCore.Qt.ShortcutContext.WidgetWithChildrenShortcut)
+            action.triggered.connect(lambda checked=False, key=key: self._forward_qpt_key(key))
+            self.addAction(action)
         
         print("[QPT] OK: QuickPaintPalette.init_ui completed")
     
-    def keyPressEvent(self, event):
+    def _forward_qpt_key(self, key: int) -> bool:
         """
-        Forward QPT-related keys to main window so hotkeys work when sidebar has focus.
-        """
-        if self._forward_qpt_key(event):
-            return
-        super().keyPressEvent(event)
-    
-    def eventFilter(self, obj, event):
-        """
-        Event filter to capture key events from child widgets and forward QPT hotkeys.
-        """
-        if event.type() == QtCore.QEvent.Type.KeyPress:
-            if self._forward_qpt_key(event):
-                return True  # Event handled
-        return super().eventFilter(obj, event)
-    
-    def _forward_qpt_key(self, event) -> bool:
-        """
-        Check if key is a QPT hotkey and forward to main window.
+        Forward a QPT hotkey to the main window so hotkeys work when the sidebar has focus.
+        
+        The forwarded event carries only the key code (no modifiers, no text);
+        the main window's QPT hotkey handling looks at nothing else.
         Returns True if key was forwarded.
         """
-        # QPT hotkeys that should be forwarded
-        qpt_keys = (
-            QtCore.Qt.Key.Key_Q.value,
-            QtCore.Qt.Key.Key_S.value,
-            QtCore.Qt.Key.Key_C.value,
-            QtCore.Qt.Key.Key_E.value,
-            QtCore.Qt.Key.Key_F.value,
-            QtCore.Qt.Key.Key_D.value,
-            QtCore.Qt.Key.Key_Escape.value,
-            QtCore.Qt.Key.Key_F1.value
-        )
-        
-        if event.key() in qpt_keys:
-            # Forward to main window's keyPressEvent
-            from reggie.core import globals_
-            if hasattr(globals_, 'mainWindow') and globals_.mainWindow:
-                globals_.mainWindow.keyPressEvent(event)
-                return True
-        return False
-    
-    def _install_event_filter_recursive(self, widget):
-        """Install event filter on widget and all its children."""
-        widget.installEventFilter(self)
-        for child in widget.findChildren(QtWidgets.QWidget):
-            child.installEventFilter(self)
+        main_window = getattr(_imports().globals_, 'mainWindow', None)
+        if not main_window:
+            return False
+        event = QtGui.QKeyEvent(QtCore.QEvent.Type.KeyPress, key, QtCore.Qt.KeyboardModifier.NoModifier)
+        main_window.keyPressEvent(event)
+        return True
     
+    @QtCore.pyqtSlot()
     def _initialize_default_tool(self):
         """Initialize with QPT as the default active tool"""
-        from reggie.plugins.quickpaint.core.tool_manager import ToolType
         self.tool_manager.activate_tool(ToolType.QPT_SMART_PAINT)
         # Deselect any Fill/Deco radio buttons
+        self._deselect_tool_radios()
+        self._update_tool_label("Active: Quick Paint", "#2d5a2d")
+    
+    def _deselect_tool_radios(self):
+        """
+        Uncheck all Fill/Deco radio buttons in the tool button group.
+        
+        Only checked buttons are touched (at most one, the group is
+        exclusive), so unchecked buttons emit no toggled signals.
+        """
+        checked = self.tool_button_group.checkedButton()
+        if checked is None:
+            return
+        # An exclusive group does not allow unchecking its checked button
         self.tool_button_group.setExclusive(False)
-        for btn in self.tool_button_group.buttons():
-            btn.setChecked(False)
+        checked.setChecked(False)
         self.tool_button_group.setExclusive(True)
-        self._update_tool_label("Active: Quick Paint", "#2d5a2d")
     
     def _on_qpt_mode_selected(self, mode: str):
         """Handle QPT mode selection from combobox - deselect Fill/Deco radio buttons"""
         # Deselect all radio buttons in the button group
-        self.tool_button_group.setExclusive(False)
-        for btn in self.tool_button_group.buttons():
-            btn.setChecked(False)
-        self.tool_button_group.setExclusive(True)
+        self._deselect_tool_radios()
     
     def _on_tab_changed(self, index: int):
         """Handle tab change - activate appropriate tool for new tab"""
-        from reggie.plugins.quickpaint.core.tool_manager import ToolType
         
         # Skip if same tab (avoid redundant deactivation/activation)
         if index == self._current_tab_index:
@@ -2271,25 +3208,28 @@ class QuickPaintPalette(QtWidgets.QWidget):
         # Don't deactivate tools or change active tool when switching within Quick Paint tabs
         # Tools should only change via radio buttons or hotkeys
         # Just update the cursor to ensure it's correct for the active tool
-        from reggie.core import globals_
+        globals_ = _imports().globals_
         if hasattr(globals_, 'mainWindow') and globals_.mainWindow and globals_.mainWindow.view:
             # Update cursor based on active tool
             if self.tool_manager.is_any_fill_active():
-                globals_.mainWindow.view.setCursor(QtCore.Qt.CursorShape.CrossCursor)
+                _set_view_cursor(globals_.mainWindow.view, QtCore.Qt.CursorShape.CrossCursor)
             else:
-                globals_.mainWindow.view.setCursor(QtCore.Qt.CursorShape.ArrowCursor)
+                _set_view_cursor(globals_.mainWindow.view, QtCore.Qt.CursorShape.ArrowCursor)
     
     def _update_tool_label(self, text: str, bg_color: str):
-        """Update the active tool label"""
+        """Update the active tool label (the stylesheet only when the color changes)"""
         self.active_tool_label.setText(text)
-        self.active_tool_label.setStyleSheet(
-            f"background-color: {bg_color}; color: white; padding: 2px 6px; "
-            "font-weight: bold; font-size: 9pt;"
-        )
+        if bg_color == self._tool_label_color:
+            return
+        self._tool_label_color = bg_color
+        stylesheet = _TOOL_LABEL_STYLESHEETS.get(bg_color)
+        if stylesheet is None:
+            stylesheet = (f"background-color: {bg_color}; color: white; padding: 2px 6px; "
+                          "font-weight: bold; font-size: 9pt;")
+        self.active_tool_label.setStyleSheet(stylesheet)
     
     def _on_tool_changed(self, new_tool, old_tool):
         """Handle tool change from tool manager"""
-        from reggie.plugins.quickpaint.core.tool_manager import ToolType
         
         display_name = self.tool_manager.get_tool_display_name()
         
@@ -2297,35 +3237,26 @@ class QuickPaintPalette(QtWidgets.QWidget):
         if new_tool not in (ToolType.FILL_PAINT, ToolType.DECO_FILL):
             if old_tool in (ToolType.FILL_PAINT, ToolType.DECO_FILL):
                 self.fill_paint_tab.fill_engine.cancel_fill()
-                self.fill_paint_tab.status_label.setText("Idle")
+                self.fill_paint_tab.set_status("Idle")
         
         # Update label with appropriate color
-        if new_tool in (ToolType.QPT_SMART_PAINT, ToolType.QPT_SINGLE_TILE, 
-                        ToolType.QPT_ERASER, ToolType.QPT_SHAPE_CREATOR):
-            self._update_tool_label(f"Active: {display_name}", "#2d5a2d")
-            # Deselect Fill/Deco radio buttons when a QPT mode is active
-            self.tool_button_group.setExclusive(False)
-            for btn in self.tool_button_group.buttons():
-                btn.setChecked(False)
-            self.tool_button_group.setExclusive(True)
-        elif new_tool == ToolType.FILL_PAINT:
-            self._update_tool_label(f"Active: {display_name}", "#3d6a9f")
-            # Fill radio button is already checked via button group
-        elif new_tool == ToolType.DECO_FILL:
-            self._update_tool_label(f"Active: {display_name}", "#5a3d7a")
-            # Deco radio button is already checked via button group
-        elif new_tool == ToolType.TILESET_OVERLAY:
-            self._update_tool_label(f"Active: {display_name}", "#7a5a3d")
+        color = _TOOL_LABEL_COLORS.get(new_tool)
+        if color is None:
+            self._update_tool_label("No Tool", _NO_TOOL_COLOR)
         else:
-            self._update_tool_label("No Tool", "#555555")
+            self._update_tool_label(f"Active: {display_name}", color)
+        
+        # Deselect Fill/Deco radio buttons when a QPT mode is active (for
+        # Fill/Deco the radio button is already checked via button group)
+        if new_tool in _QPT_TOOLS:
+            self._deselect_tool_radios()
         
         # Update cursor on the MAIN WINDOW's graphics view, not the sidebar
         self._update_canvas_cursor(new_tool)
     
     def _update_canvas_cursor(self, tool):
         """Update cursor on the main canvas based on active tool"""
-        from reggie.plugins.quickpaint.core.tool_manager import ToolType
-        from reggie.core import globals_
+        globals_ = _imports().globals_
         
         if not hasattr(globals_, 'mainWindow') or globals_.mainWindow is None:
             return
@@ -2336,9 +3267,9 @@ class QuickPaintPalette(QtWidgets.QWidget):
             return
         
         if tool == ToolType.FILL_PAINT or tool == ToolType.DECO_FILL:
-            view.setCursor(QtCore.Qt.CursorShape.CrossCursor)
+            _set_view_cursor(view, QtCore.Qt.CursorShape.CrossCursor)
         else:
-            view.setCursor(QtCore.Qt.CursorShape.ArrowCursor)
+            _set_view_cursor(view, QtCore.Qt.CursorShape.ArrowCursor)
     
     def handle_hotkey(self, key: int) -> bool:
         """
@@ -2350,73 +3281,58 @@ class QuickPaintPalette(QtWidgets.QWidget):
         Returns:
             True if hotkey was handled
         """
-        from reggie.plugins.quickpaint.core.tool_manager import ToolType
-        
-        # Use .value for enum comparison since key is an int from event.key()
-        if key == QtCore.Qt.Key.Key_Q.value:
-            # If QPT tab is already active and tool is SmartPaint, toggle Start/Stop painting
-            if (self.tabs.currentIndex() == 0 and 
-                self.tool_manager.active_tool == ToolType.QPT_SMART_PAINT):
-                # Toggle painting
-                if self.quick_paint_tab.is_painting():
-                    self.quick_paint_tab.qpt_widget.on_stop_painting()
-                    print("[QPT] Q hotkey: Stopped painting")
-                else:
-                    self.quick_paint_tab.qpt_widget.on_start_painting()
-                    print("[QPT] Q hotkey: Started painting")
-                return True
+        handler = self._hotkey_handlers.get(key)
+        return handler() if handler else False
+    
+    def _hotkey_toggle_smart_paint(self) -> bool:
+        """Q: toggle SmartPaint painting, or switch to QPT SmartPaint"""
+        
+        # If QPT tab is already active and tool is SmartPaint, toggle Start/Stop painting
+        if (self.tabs.currentIndex() == 0 and 
+            self.tool_manager.active_tool == ToolType.QPT_SMART_PAINT):
+            # Toggle painting
+            if self.quick_paint_tab.is_painting():
+                self.quick_paint_tab.qpt_widget.on_stop_painting()
+                print("[QPT] Q hotkey: Stopped painting")
             else:
-                # Switch to QPT and activate SmartPaint
-                self.tabs.setCurrentIndex(0)
-                self.quick_paint_tab.qpt_widget.set_mode("SmartPaint")
-                self.tool_manager.activate_tool(ToolType.QPT_SMART_PAINT)
-                print("[QPT] Q hotkey: Activated QPT SmartPaint")
-                return True
-            
-        elif key == QtCore.Qt.Key.Key_S.value:
-            # Switch to QPT tab and activate Single Tile mode
-            self.tabs.setCurrentIndex(0)
-            self.quick_paint_tab.qpt_widget.set_mode("Single Tile")
-            self.tool_manager.activate_tool(ToolType.QPT_SINGLE_TILE)
-            print("[QPT] S hotkey: Activated Single Tile mode")
-            return True
-            
-        elif key == QtCore.Qt.Key.Key_C.value:
-            # Switch to QPT tab and activate Shape Creator mode
-            self.tabs.setCurrentIndex(0)
-            self.quick_paint_tab.qpt_widget.set_mode("Shape Creator")
-            self.tool_manager.activate_tool(ToolType.QPT_SHAPE_CREATOR)
-            print("[QPT] C hotkey: Activated Shape Creator mode")
-            return True
-            
-        elif key == QtCore.Qt.Key.Key_E.value:
-            # Switch to QPT tab and activate Eraser mode
-            self.tabs.setCurrentIndex(0)
-            self.quick_paint_tab.qpt_widget.set_mode("Eraser")
-            self.tool_manager.activate_tool(ToolType.QPT_ERASER)
-            print("[QPT] E hotkey: Activated Eraser mode")
-            return True
-            
-        elif key == QtCore.Qt.Key.Key_F.value:
-            # Switch to Fill tab and activate Fill Tool
-            self.tabs.setCurrentIndex(1)
-            self.fill_paint_tab.activate()
+                self.quick_paint_tab.qpt_widget.on_start_painting()
+                print("[QPT] Q hotkey: Started painting")
             return True
-            
-        elif key == QtCore.Qt.Key.Key_D.value:
-            # Switch to Fill tab and cycle through deco containers
-            self.tabs.setCurrentIndex(1)
-            self.fill_paint_tab.cycle_deco_container()
-            return True
-            
-        elif key == QtCore.Qt.Key.Key_Escape.value:
-            # Cancel current operation
-            if self.tabs.currentIndex() == 0:
-                return self.quick_paint_tab.handle_key_event(key)
-            elif self.tabs.currentIndex() == 1:
-                return self.fill_paint_tab.handle_key_event(key)
-            return False
         
+        # Switch to QPT and activate SmartPaint
+        self.tabs.setCurrentIndex(0)
+        self.quick_paint_tab.qpt_widget.set_mode("SmartPaint")
+        self.tool_manager.activate_tool(ToolType.QPT_SMART_PAINT)
+        print("[QPT] Q hotkey: Activated QPT SmartPaint")
+        return True
+    
+    def _hotkey_qpt_mode(self, key_name: str, mode: str, tool) -> bool:
+        """S/C/E: switch to the QPT tab and activate a QPT mode"""
+        self.tabs.setCurrentIndex(0)
+        self.quick_paint_tab.qpt_widget.set_mode(mode)
+        self.tool_manager.activate_tool(tool)
+        print(f"[QPT] {key_name} hotkey: Activated {mode} mode")
+        return True
+    
+    def _hotkey_fill(self) -> bool:
+        """F: switch to Fill tab and activate Fill Tool"""
+        self.tabs.setCurrentIndex(1)
+        self.fill_paint_tab.activate()
+        return True
+    
+    def _hotkey_deco(self) -> bool:
+        """D: switch to Fill tab and cycle through deco containers"""
+        self.tabs.setCurrentIndex(1)
+        self.fill_paint_tab.cycle_deco_container()
+        return True
+    
+    def _hotkey_escape(self) -> bool:
+        """Escape: cancel the current operation of the active tab"""
+        key = QtCore.Qt.Key.Key_Escape.value
+        if self.tabs.currentIndex() == 0:
+            return self.quick_paint_tab.handle_key_event(key)
+        elif self.tabs.currentIndex() == 1:
+            return self.fill_paint_tab.handle_key_event(key)
         return False
     
     def get_quick_paint_tab(self):
@@ -2467,7 +3383,6 @@ class QuickPaintPalette(QtWidgets.QWidget):
     
     def is_fill_active(self) -> bool:
         """Check if fill or deco tool is active"""
-        from reggie.plugins.quickpaint.core.tool_manager import ToolType
         return (self.tool_manager.is_active(ToolType.FILL_PAINT) or 
                 self.tool_manager.is_active(ToolType.DECO_FILL))
     
@@ -2476,20 +3391,20 @@ class QuickPaintPalette(QtWidgets.QWidget):
         Reset QPT to default state.
         Call this when level changes, area changes, or area settings are modified.
         """
-        from reggie.plugins.quickpaint.core.tool_manager import ToolType
         
         # Reset both tabs
         self.quick_paint_tab.reset()
         self.fill_paint_tab.reset()
         
-        # Switch to QPT tab and activate QPT tool
-        self.tabs.setCurrentIndex(0)
+        # Switch to QPT tab and activate QPT tool. The tabs were just reset
+        # and activating the tool below updates the cursor, so the tab-change
+        # slot has nothing left to do
+        with QtCore.QSignalBlocker(self.tabs):
+            self.tabs.setCurrentIndex(0)
+        self._current_tab_index = 0
         self.quick_paint_tab.qpt_widget.set_mode("SmartPaint")
         self.tool_manager.activate_tool(ToolType.QPT_SMART_PAINT)
         # Deselect Fill/Deco radio buttons
-        self.tool_button_group.setExclusive(False)
-        for btn in self.tool_button_group.buttons():
-            btn.setChecked(False)
-        self.tool_button_group.setExclusive(True)
+        self._deselect_tool_radios()
         
         print("[QuickPaintPalette] Reset complete - QPT activated")